@@ -1,75 +1,206 @@
 #!/usr/bin/env python3
-"""Build script for exporting marimo notebooks to WASM HTML.
+"""Build script for exporting marimo notebooks to HTML.
 
-This script exports all documentation notebooks to static HTML files
-that can be hosted on GitHub Pages.
+This script exports all documentation notebooks to HTML files that can be
+hosted on GitHub Pages, either as interactive WASM notebooks or as static
+HTML with pre-rendered outputs.
 
 Usage:
-    uv run .github/scripts/build.py
+    uv run .github/scripts/build.py                # static HTML (default)
+    uv run .github/scripts/build.py --mode wasm    # interactive WASM HTML
     python -m http.server -d _site  # Serve locally for testing
 """
 from __future__ import annotations
 
-import subprocess
+import argparse
+import hashlib
+import json
 import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 # Configuration
-NOTEBOOKS_DIR = Path("src/markdown_table_extractor/core")
+NOTEBOOKS_DIR = Path("src/markdown_table_extractor")
 OUTPUT_DIR = Path("_site")
+# Kept outside OUTPUT_DIR so build hashes aren't published with the site
+MANIFEST_PATH = Path(".cache/build-manifest.json")
+# `marimo export` subcommand and extra arguments for each build mode
+EXPORT_MODES = {
+    "static": {
+        "command": "html",
+        "args": ["--no-include-code"],
+        "label": "static HTML",
+    },
+    "wasm": {
+        "command": "html-wasm",
+        "args": ["--mode", "run"],
+        "label": "WASM HTML",
+    },
+}
 NOTEBOOKS = {
-    "index.py": {"output": "index.html", "name": "index"},
-    "parser.py": {"output": "parser.html", "name": "parser"},
-    "cleaner.py": {"output": "cleaner.html", "name": "cleaner"},
-    "merger.py": {"output": "merger.html", "name": "merger"},
-    "extractor.py": {"output": "extractor.html", "name": "extractor"},
-    "models.py": {"output": "models.html", "name": "models"},
+    "notebooks/index.py": {"output": "index.html", "name": "index"},
+    "notebooks/parser.py": {"output": "parser.html", "name": "parser"},
+    "notebooks/cleaner.py": {"output": "cleaner.html", "name": "cleaner"},
+    "notebooks/merger.py": {"output": "merger.html", "name": "merger"},
+    "notebooks/extractor.py": {"output": "extractor.html", "name": "extractor"},
+    "notebooks/models.py": {"output": "models.html", "name": "models"},
 }
 
 
-def main():
-    """Export all notebooks to WASM HTML."""
+def _marimo_version() -> str:
+    """Return the installed marimo version (part of the cache key)."""
+    try:
+        return version("marimo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _library_hash() -> str:
+    """Hash the package sources the notebooks import.
+
+    Static exports run each notebook against the local library and bake
+    its outputs into the HTML, so a library change must invalidate every
+    notebook even when the notebook file itself is unchanged.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(NOTEBOOKS_DIR.rglob("*.py")):
+        relative = path.relative_to(NOTEBOOKS_DIR)
+        if relative.parts[0] == "notebooks":
+            continue
+        digest.update(str(relative).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _notebook_hash(
+    notebook_path: Path, library_hash: str, marimo_version: str, mode: str
+) -> str:
+    """Hash notebook source + library sources + marimo version + export mode."""
+    digest = hashlib.sha256(notebook_path.read_bytes())
+    digest.update(library_hash.encode())
+    digest.update(marimo_version.encode())
+    digest.update(mode.encode())
+    return digest.hexdigest()
+
+
+def _load_manifest() -> dict[str, str]:
+    """Load the manifest of previously built notebook hashes."""
+    if not MANIFEST_PATH.exists():
+        return {}
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def _export_one(
+    notebook_file: str, config: dict[str, str], mode: str
+) -> tuple[str, Path, subprocess.CalledProcessError | None]:
+    """Export a single notebook, returning (name, output_path, error)."""
+    notebook_path = NOTEBOOKS_DIR / notebook_file
+    output_path = OUTPUT_DIR / config["output"]
+    export = EXPORT_MODES[mode]
+
+    # Reuse this interpreter instead of `uv run`, which re-resolves the
+    # environment on every invocation
+    cmd = [
+        sys.executable,
+        "-m",
+        "marimo",
+        "export",
+        export["command"],
+        str(notebook_path),
+        "-o",
+        str(output_path),
+        *export["args"],
+    ]
+
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        return config["name"], output_path, e
+    return config["name"], output_path, None
+
+
+def build(mode: str, notebooks: dict[str, dict[str, str]]) -> None:
+    """Export notebooks to HTML using the given export mode."""
+    label = EXPORT_MODES[mode]["label"]
     print("=" * 60)
-    print("Building marimo documentation site")
+    print(f"Building marimo documentation site ({label})")
     print("=" * 60)
     print()
 
-    # Clean output directory
-    if OUTPUT_DIR.exists():
-        print(f"Cleaning {OUTPUT_DIR}...")
-        shutil.rmtree(OUTPUT_DIR)
-
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    # Export each notebook
-    for notebook_file, config in NOTEBOOKS.items():
-        notebook_path = NOTEBOOKS_DIR / notebook_file
-        output_filename = config["output"]
-        output_path = OUTPUT_DIR / output_filename
-        name = config["name"]
-
-        print(f"📓 Exporting {name} to static HTML...")
-
-        # Export command - static HTML with pre-rendered outputs, code hidden
-        cmd = [
-            "uv",
-            "run",
-            "marimo",
-            "export",
-            "html",
-            str(notebook_path),
-            "-o",
-            str(output_path),
-            "--no-include-code",
-        ]
-
-        try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            print(f"   ✓ Exported to {output_path}")
-        except subprocess.CalledProcessError as e:
-            print(f"   ✗ Failed to export {name}")
-            print(f"   Error: {e.stderr}")
-            raise
+    # Skip notebooks whose source, library sources, marimo version and export
+    # mode are unchanged since the last build (manifest restored from the CI
+    # cache)
+    manifest = _load_manifest()
+    library_hash = _library_hash()
+    marimo_version = _marimo_version()
+    pending: dict[str, str] = {}
+    for notebook_file, config in notebooks.items():
+        output_path = OUTPUT_DIR / config["output"]
+        current_hash = _notebook_hash(
+            NOTEBOOKS_DIR / notebook_file, library_hash, marimo_version, mode
+        )
+        if manifest.get(notebook_file) == current_hash and output_path.exists():
+            print(f"⏭  {config['name']} unchanged, skipping")
+            continue
+        # Only clean outputs that are about to be rebuilt
+        if output_path.is_dir():
+            shutil.rmtree(output_path)
+        elif output_path.exists():
+            output_path.unlink()
+        pending[notebook_file] = current_hash
+
+    # Export notebooks concurrently - each export is an independent subprocess
+    with ThreadPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+        futures = {
+            executor.submit(
+                _export_one, notebook_file, notebooks[notebook_file], mode
+            ): notebook_file
+            for notebook_file in pending
+        }
+        for future in as_completed(futures):
+            # Print each result only once its export has finished so that
+            # output from concurrent exports doesn't interleave
+            name, output_path, error = future.result()
+            if error is None:
+                print(f"📓 Exported {name} to {label}")
+                print(f"   ✓ Exported to {output_path}")
+                notebook_file = futures[future]
+                manifest[notebook_file] = pending[notebook_file]
+            else:
+                print(f"   ✗ Failed to export {name}")
+                print(f"   Error: {error.stderr}")
+                MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+                raise error
+
+    # A cache restored by prefix can hold pages for notebooks that have
+    # since been renamed or removed; drop them along with their hashes
+    expected = {config["output"] for config in notebooks.values()}
+    for stale in sorted(OUTPUT_DIR.glob("*.html")):
+        if stale.name not in expected:
+            if stale.is_dir():
+                shutil.rmtree(stale)
+            else:
+                stale.unlink()
+            print(f"🗑  Removed stale {stale}")
+    # Older builds kept the manifest inside the site; don't publish it
+    (OUTPUT_DIR / ".build-manifest.json").unlink(missing_ok=True)
+    manifest = {
+        notebook_file: digest
+        for notebook_file, digest in manifest.items()
+        if notebook_file in notebooks
+    }
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    print(f"✓ Updated {MANIFEST_PATH}")
 
     # Create .nojekyll file
     nojekyll = OUTPUT_DIR / ".nojekyll"
@@ -91,7 +222,7 @@ This site contains interactive documentation for the markdown-table-extractor li
 - [Extractor](./extractor.html) - Main extraction API
 - [Models](./models.html) - Data models and types
 
-All documentation is powered by [marimo](https://marimo.io) with pre-rendered static HTML!
+All documentation is powered by [marimo](https://marimo.io)!
 """)
     print(f"✓ Created {readme}")
 
@@ -110,5 +241,18 @@ All documentation is powered by [marimo](https://marimo.io) with pre-rendered st
     print()
 
 
+def main() -> None:
+    """Parse arguments and build the documentation site."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode",
+        choices=sorted(EXPORT_MODES),
+        default="static",
+        help="Export as static HTML (default) or interactive WASM HTML",
+    )
+    args = parser.parse_args()
+    build(args.mode, NOTEBOOKS)
+
+
 if __name__ == "__main__":
     main()
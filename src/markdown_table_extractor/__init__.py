@@ -26,24 +26,59 @@ Usage:
         print(table.dataframe)
 """
 
-from markdown_table_extractor.core.extractor import (
-    extract_markdown_tables,
-    extract_tables,
-)
-from markdown_table_extractor.core.models import (
-    ExtractedTable,
-    ExtractionResult,
-    TableMergeStrategy,
-)
-from markdown_table_extractor.core.parser import (
-    is_separator_row,
-    is_table_row,
-    parse_table_row,
-)
-from markdown_table_extractor.core.cleaner import (
-    clean_column_name,
-    normalize_headers,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from markdown_table_extractor.core.extractor import (
+        extract_markdown_tables,
+        extract_tables,
+    )
+    from markdown_table_extractor.core.models import (
+        ExtractedTable,
+        ExtractionResult,
+        TableMergeStrategy,
+    )
+    from markdown_table_extractor.core.parser import (
+        is_separator_row,
+        is_table_row,
+        parse_table_row,
+    )
+    from markdown_table_extractor.core.cleaner import (
+        clean_column_name,
+        normalize_headers,
+    )
+
+# Public names are imported on first access (PEP 562) so that importing a
+# submodule such as the CLI doesn't pay for pandas up front
+_LAZY_IMPORTS = {
+    "extract_markdown_tables": "markdown_table_extractor.core.extractor",
+    "extract_tables": "markdown_table_extractor.core.extractor",
+    "ExtractedTable": "markdown_table_extractor.core.models",
+    "ExtractionResult": "markdown_table_extractor.core.models",
+    "TableMergeStrategy": "markdown_table_extractor.core.models",
+    "is_separator_row": "markdown_table_extractor.core.parser",
+    "is_table_row": "markdown_table_extractor.core.parser",
+    "parse_table_row": "markdown_table_extractor.core.parser",
+    "clean_column_name": "markdown_table_extractor.core.cleaner",
+    "normalize_headers": "markdown_table_extractor.core.cleaner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "0.1.0"
 
@@ -11,10 +11,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
+import stat
 import sys
+import tempfile
+import textwrap
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 
 def main(args: Optional[list[str]] = None) -> int:
@@ -83,11 +88,15 @@ def main(args: Optional[list[str]] = None) -> int:
 
 def cmd_extract(args: argparse.Namespace) -> int:
     """Execute the extract command."""
-    from markdown_table_extractor import (
-        extract_markdown_tables,
-        TableMergeStrategy,
-    )
-    
+    # Rich tables only render to a terminal; reject before any work is done
+    if args.format == "rich" and args.output:
+        print(
+            "Error: rich output can't be written to a file. "
+            "Use --format csv, json or markdown with --output",
+            file=sys.stderr
+        )
+        return 1
+
     # Read input
     if str(args.input) == "-":
         text = sys.stdin.read()
@@ -121,6 +130,11 @@ def cmd_extract(args: argparse.Namespace) -> int:
             )
             return 1
     else:
+        from markdown_table_extractor import (
+            extract_markdown_tables,
+            TableMergeStrategy,
+        )
+
         strategy = (
             TableMergeStrategy.NONE 
             if args.no_merge 
@@ -151,56 +165,136 @@ def cmd_extract(args: argparse.Namespace) -> int:
     if fmt == "rich" and not args.output:
         # Rich tables go directly to console, not through string
         format_rich_tables(result)
+    elif args.output:
+        write_output_file(result, fmt, args.output)
+        if args.verbose:
+            print(f"Wrote to {args.output}", file=sys.stderr)
     else:
-        output_text = format_output(result, fmt)
-
-        if args.output:
-            args.output.write_text(output_text)
-            if args.verbose:
-                print(f"Wrote to {args.output}", file=sys.stderr)
-        else:
-            print(output_text)
+        stream_output(result, fmt, sys.stdout)
+        sys.stdout.write("\n")
 
     return 0
 
 
+def write_output_file(result, fmt: str, path: Path) -> None:
+    """Stream extraction result to a temporary file, then move it into place.
+
+    The target is only replaced once every table has been written, so a
+    formatting error leaves an existing file untouched and no partial
+    output behind. Devices (``/dev/stdout``), FIFOs and hard-linked files
+    are written in place instead: swapping in a new file would replace the
+    node or break the link.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and (
+        not stat.S_ISREG(st.st_mode)
+        or st.st_nlink > 1
+        or path.absolute().parts[1:2] in (("dev",), ("proc",))
+    ):
+        with path.open("w") as fp:
+            stream_output(result, fmt, fp)
+        return
+
+    target = path.resolve()
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            stream_output(result, fmt, fp)
+        # mkstemp creates the file 0600 and owned by us; carry over the
+        # replaced file's mode and (where permitted) owner, or use the
+        # permissions a plain open() would have
+        if st is not None:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+            if hasattr(os, "chown") and (st.st_uid, st.st_gid) != (
+                os.getuid(),
+                os.getgid(),
+            ):
+                try:
+                    os.chown(tmp, st.st_uid, st.st_gid)
+                except OSError:
+                    pass
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def format_output(result, fmt: str) -> str:
     """Format extraction result for output."""
-    from markdown_table_extractor import ExtractionResult
-    
+    buffer = io.StringIO()
+    stream_output(result, fmt, buffer)
+    return buffer.getvalue()
+
+
+def stream_output(result, fmt: str, fp: TextIO) -> None:
+    """Write extraction result to a file object one table at a time.
+
+    Each table is serialized and written before the next one is formatted,
+    so peak memory is bounded by the largest table rather than the whole
+    output.
+    """
+    if fmt not in ("csv", "json", "markdown"):
+        raise ValueError(f"Unknown format: {fmt}")
+
+    last = len(result.tables) - 1
+
     if fmt == "csv":
-        # Concatenate all tables with separator
-        parts = []
+        # Tables separated by a blank line, each preceded by its caption
         for i, table in enumerate(result.tables):
             if table.caption:
-                parts.append(f"# {table.caption}")
-            parts.append(table.dataframe.to_csv(index=False))
-            if i < len(result.tables) - 1:
-                parts.append("")  # Blank line between tables
-        return "\n".join(parts)
-    
+                fp.write(f"# {table.caption}\n")
+            table.dataframe.to_csv(fp, index=False, lineterminator="\n")
+            if i < last:
+                fp.write("\n\n")
+
     elif fmt == "json":
-        tables_data = []
-        for table in result.tables:
-            tables_data.append({
-                "caption": table.caption,
-                "rows": table.row_count,
-                "columns": list(table.dataframe.columns),
-                "data": table.dataframe.to_dict(orient="records"),
-            })
-        return json.dumps(tables_data, indent=2)
-    
-    elif fmt == "markdown":
-        parts = []
-        for table in result.tables:
+        # Stream a JSON array, dumping one table object at a time
+        if not result.tables:
+            fp.write("[]")
+            return
+        fp.write("[\n")
+        for i, table in enumerate(result.tables):
+            fp.write(textwrap.indent(_table_json(table), "  "))
+            fp.write(",\n" if i < last else "\n")
+        fp.write("]")
+
+    else:
+        for i, table in enumerate(result.tables):
             if table.caption:
-                parts.append(f"## {table.caption}\n")
-            parts.append(table.dataframe.to_markdown(index=False))
-            parts.append("")
-        return "\n".join(parts)
-    
+                fp.write(f"## {table.caption}\n\n")
+            fp.write(table.dataframe.to_markdown(index=False))
+            fp.write("\n")
+            if i < last:
+                fp.write("\n")
+
+
+def _table_json(table) -> str:
+    """Serialize one table as an indented JSON object."""
+    df = table.dataframe
+    meta = json.dumps({
+        "caption": table.caption,
+        "rows": table.row_count,
+        "columns": list(df.columns),
+    }, indent=2)
+
+    if df.columns.is_unique:
+        # Splice in pandas' C serializer output instead of round-tripping
+        # every cell through to_dict() + json.dumps()
+        data = df.to_json(orient="records", indent=2)
     else:
-        raise ValueError(f"Unknown format: {fmt}")
+        # to_json rejects duplicate column names for orient="records"
+        data = json.dumps(df.to_dict(orient="records"), indent=2)
+
+    # Drop meta's closing brace and append the data field
+    return f'{meta[:-2]},\n  "data": {textwrap.indent(data, "  ").lstrip()}\n}}'
 
 
 def format_rich_tables(result) -> None:
@@ -227,9 +321,9 @@ def format_rich_tables(result) -> None:
         for col in df.columns:
             rich_table.add_column(str(col), overflow="fold")
 
-        # Add rows
-        for _, row in df.iterrows():
-            rich_table.add_row(*[str(val) for val in row])
+        # Add rows (plain tuples - iterrows builds a Series per row)
+        for row in df.itertuples(index=False, name=None):
+            rich_table.add_row(*map(str, row))
 
         # Display table
         console.print(rich_table)
@@ -6,6 +6,7 @@ from markdown_table_extractor.core.models import (
 )
 from markdown_table_extractor.core.parser import (
     detect_caption,
+    is_separator_cells,
     is_separator_row,
     is_sub_header_row,
     is_table_row,
@@ -33,6 +34,7 @@ __all__ = [
     "TableMergeStrategy",
     # Parser
     "detect_caption",
+    "is_separator_cells",
     "is_separator_row",
     "is_sub_header_row",
     "is_table_row",
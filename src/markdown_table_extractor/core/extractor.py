@@ -4,7 +4,6 @@ This module provides the primary API for extracting tables from markdown.
 """
 from __future__ import annotations
 
-import marimo
 from typing import Optional
 
 import pandas as pd
@@ -16,6 +15,7 @@ from markdown_table_extractor.core.models import (
 )
 from markdown_table_extractor.core.parser import (
     detect_caption,
+    is_separator_cells,
     is_separator_row,
     is_sub_header_row,
     is_table_row,
@@ -29,10 +29,6 @@ from markdown_table_extractor.core.cleaner import (
 from markdown_table_extractor.core.merger import merge_tables
 
 
-# ============================================================================
-# MODULE-LEVEL CODE (importable)
-# ============================================================================
-
 
 def extract_single_table(
     lines: list[str],
@@ -51,15 +47,12 @@ def extract_single_table(
     Returns:
         Tuple of (ExtractedTable, end_index)
     """
-    table_lines: list[str] = []
-    raw_lines: list[str] = []
     idx = start_idx
     
     # Collect all table rows
     while idx < len(lines) and is_table_row(lines[idx]):
-        table_lines.append(lines[idx])
-        raw_lines.append(lines[idx])
         idx += 1
+    table_lines = lines[start_idx:idx]
     
     if len(table_lines) < 2:
         # Need at least header + separator
@@ -88,7 +81,8 @@ def extract_single_table(
 
     # Check if main header is mostly empty (>70% empty cells)
     # If so, the row after separator likely contains the real headers
-    header_empty_count = sum(1 for h in headers if not h.strip())
+    # Headers are already stripped by clean_column_name, so truthiness suffices
+    header_empty_count = sum(1 for h in headers if not h)
     header_mostly_empty = header_empty_count / len(headers) > 0.7 if headers else False
 
     if skip_sub_headers and data_start < len(table_lines):
@@ -100,15 +94,15 @@ def extract_single_table(
             new_headers = []
             for old_h, new_h in zip(headers, next_row_cells):
                 new_h_clean = clean_column_name(new_h)
-                if new_h_clean.strip():
+                if new_h_clean:
                     # Next row has content - use it, possibly with prefix from header
-                    if old_h.strip():
-                        new_headers.append(f"{old_h.strip()} {new_h_clean}")
+                    if old_h:
+                        new_headers.append(f"{old_h} {new_h_clean}")
                     else:
                         new_headers.append(new_h_clean)
                 else:
                     # Next row empty - keep old header
-                    new_headers.append(old_h.strip())
+                    new_headers.append(old_h)
             headers = new_headers
             data_start += 1
         elif is_sub_header_row(table_lines[data_start]):
@@ -122,19 +116,22 @@ def extract_single_table(
     expected_cols = len(headers)
 
     for line in table_lines[data_start:]:
-        if not is_separator_row(line):
-            cells = parse_table_row(line)
-            cells = [clean_value(c) for c in cells]
+        # Split once and test the parsed cells for a separator, instead of
+        # letting is_separator_row split the line again
+        raw_cells = parse_table_row(line)
+        if '-' in line and is_separator_cells(raw_cells):
+            continue
+
+        # Trim to header count before cleaning so surplus cells are
+        # never cleaned; map() avoids the comprehension's per-cell
+        # bytecode (pandas .str chains benchmarked ~3x slower here)
+        cells = list(map(clean_value, raw_cells[:expected_cols]))
 
-            # Normalize row length to match header count
-            if len(cells) < expected_cols:
-                # Pad with empty strings
-                cells.extend([""] * (expected_cols - len(cells)))
-            elif len(cells) > expected_cols:
-                # Trim to header count
-                cells = cells[:expected_cols]
+        # Pad short rows with empty strings to match header count
+        if len(cells) < expected_cols:
+            cells.extend([""] * (expected_cols - len(cells)))
 
-            data_rows.append(cells)
+        data_rows.append(cells)
 
     # Create DataFrame
     df = pd.DataFrame(data_rows, columns=headers)
@@ -144,7 +141,9 @@ def extract_single_table(
     is_continuation = False
     table_number = None
     is_bare_caption = False
-    if detect_captions:
+    # Tables without data rows are dropped by the caller, so skip the
+    # backward caption scan for them
+    if detect_captions and not df.empty:
         caption, is_continuation, table_number, is_bare_caption = detect_caption(lines, start_idx)
 
     table = ExtractedTable(
@@ -152,7 +151,7 @@ def extract_single_table(
         caption=caption,
         start_line=start_idx,
         end_line=idx,
-        raw_markdown="\n".join(raw_lines),
+        raw_markdown="\n".join(table_lines),
         is_continuation=is_continuation,
     )
 
@@ -235,224 +234,3 @@ def extract_tables(text: str) -> list[pd.DataFrame]:
     """
     result = extract_markdown_tables(text)
     return result.get_dataframes()
-
-
-# ============================================================================
-# MARIMO NOTEBOOK (interactive documentation)
-# ============================================================================
-
-app = marimo.App(width="medium")
-
-
-@app.cell
-def _():
-    import marimo as mo
-    from markdown_table_extractor.core.extractor import (
-        extract_tables,
-        extract_markdown_tables,
-        extract_single_table,
-    )
-    return (mo, extract_tables, extract_markdown_tables, extract_single_table)
-
-
-@app.cell
-def _(mo):
-    mo.md("# Table Extractor")
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `extract_tables(text: str) -> list[pd.DataFrame]`
-
-    **Simple API** - Returns just DataFrames.
-    """)
-    return
-
-
-@app.cell
-def _(mo, extract_tables):
-    _simple_md = """
-| Name | Score |
-|------|-------|
-| Alice | 95 |
-| Bob | 87 |
-"""
-
-    _tables = extract_tables(_simple_md)
-
-    mo.vstack([
-        mo.md("**Input markdown:**"),
-        mo.md(_simple_md),
-        mo.md("**Extracted DataFrame:**"),
-        mo.ui.table(_tables[0], selection=None),
-        mo.callout(f"Extracted {len(_tables)} table(s)", kind="success"),
-    ])
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `extract_markdown_tables(text, ...) -> ExtractionResult`
-
-    **Full API** - Returns tables with metadata (captions, line numbers, etc.).
-    """)
-    return
-
-
-@app.cell
-def _(mo, extract_markdown_tables):
-    _full_md = """
-Table 1. Test Results
-
-| Name | Score |
-|------|-------|
-| Alice | 95 |
-"""
-
-    _result = extract_markdown_tables(_full_md)
-
-    mo.vstack([
-        mo.md("**Extracted with metadata:**"),
-        mo.md(f"- Caption: `{_result[0].caption}`"),
-        mo.md(f"- Rows: {_result[0].row_count}, Columns: {_result[0].column_count}"),
-        mo.ui.table(_result[0].dataframe, selection=None),
-    ])
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ---
-
-    ## 🎯 End-to-End Demo with Continuation Tables
-    """)
-    return
-
-
-@app.cell
-def _(mo):
-    sample_markdown = """
-# Sample Document
-
-Table 1. Test Results
-
-| Name | Score | Grade |
-|------|-------|-------|
-| Alice | 95 | A |
-| Bob | 87 | B |
-| Carol | 92 | A |
-
-Some text between tables.
-
-Table 2. Summary
-
-| Metric | Value |
-|--------|-------|
-| Mean | 91.3 |
-| Median | 92 |
-"""
-
-    mo.vstack([
-        mo.md("### Input Markdown"),
-        mo.md(f"```markdown\n{sample_markdown}\n```"),
-    ])
-    return (sample_markdown,)
-
-
-@app.cell
-def _(mo, extract_markdown_tables, sample_markdown):
-    # Extract tables with full visualization
-    _result = extract_markdown_tables(sample_markdown)
-
-    mo.vstack([
-        mo.md("### Extraction Results"),
-        mo.callout(
-            f"Found **{len(_result)} tables** | Errors: {len(_result.errors)} | Merged: {_result.merged_count}",
-            kind="success" if not _result.has_errors else "warn"
-        ),
-
-        mo.md("### Extracted Tables"),
-        mo.accordion({
-            f"Table {i+1}: {table.caption}": mo.vstack([
-                mo.md(f"""
-                **Table Information:**
-                - Caption: `{table.caption}`
-                - Rows: {table.row_count}
-                - Columns: {table.column_count}
-                - Lines: {table.start_line}–{table.end_line}
-                """),
-                mo.md("**Data:**"),
-                mo.ui.table(table.dataframe),
-            ])
-            for i, table in enumerate(_result.tables)
-        }),
-    ])
-    return (_result,)
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## 📊 Complex Example: Continuation Tables
-
-    Demonstration of automatic table merging with continuation markers.
-    """)
-    return
-
-
-@app.cell
-def _(mo, extract_markdown_tables):
-    _complex_md = """
-Table 3. Patient Demographics
-
-| ID | Name  | Age | Gender |
-|----|-------|-----|--------|
-| 1  | Alice | 45  | F      |
-| 2  | Bob   | 52  | M      |
-
-Table 3 (Continued)
-
-| ID | Name  | Age | Gender |
-|----|-------|-----|--------|
-| 3  | Carol | 38  | F      |
-| 4  | Dave  | 61  | M      |
-"""
-
-    _complex_result = extract_markdown_tables(_complex_md)
-
-    mo.vstack([
-        mo.md("### Input (Two Tables with Continuation Marker)"),
-        mo.md(f"```markdown\n{_complex_md}\n```"),
-
-        mo.md("### Output (Automatically Merged)"),
-        mo.callout(
-            f"Merged **{_complex_result.merged_count} continuation table** → Result: **{len(_complex_result)} table** with **{_complex_result[0].row_count} total rows**",
-            kind="success"
-        ),
-
-        mo.ui.table(_complex_result[0].dataframe),
-
-        mo.md("### How It Works"),
-        mo.accordion({
-            "Detection": mo.md("""
-            1. **Caption Detection**: Found "Table 3 (Continued)" marker
-            2. **Header Matching**: Verified columns match previous table
-            3. **Auto-Merge**: Combined into single DataFrame
-            """),
-            "Configuration": mo.md("""
-            You can control merging behavior with `merge_strategy`:
-            - `IDENTICAL_HEADERS` (default) - Merge if headers match
-            - `COMPATIBLE_COLUMNS` - Merge if column counts ±2
-            - `NONE` - Don't merge, keep separate
-            """),
-        }),
-    ])
-    return
-
-
-if __name__ == "__main__":
-    app.run()
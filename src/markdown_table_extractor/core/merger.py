@@ -4,24 +4,21 @@ Handles merging adjacent tables that are continuations of each other.
 """
 from __future__ import annotations
 
-import marimo
-import re
 from typing import Optional
 
 import pandas as pd
 
 from markdown_table_extractor.core.models import ExtractedTable, TableMergeStrategy
 from markdown_table_extractor.core.cleaner import headers_match
+from markdown_table_extractor.core.parser import CONTINUATION_PATTERN
 
-
-# ============================================================================
-# MODULE-LEVEL CODE (importable)
-# ============================================================================
-
-CONTINUATION_PATTERN = re.compile(
-    r"\(?\s*(?:continued|cont\.?|cont'd)\s*\)?",
-    re.IGNORECASE,
-)
+# Optional fuzzy header matching (pip install 'markdown-table-extractor[smart-merge]').
+# Resolved once here: a failed import inside the function is retried, and
+# re-scans sys.path, on every table pair.
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:
+    _fuzz = None
 
 
 def is_continuation_table(table: ExtractedTable) -> bool:
@@ -36,7 +33,13 @@ def is_continuation_table(table: ExtractedTable) -> bool:
     if table.is_continuation:
         return True
 
-    if table.caption and CONTINUATION_PATTERN.search(table.caption):
+    # Every marker contains "cont"; the substring test rejects most captions
+    # without entering the regex engine
+    if (
+        table.caption
+        and "cont" in table.caption.lower()
+        and CONTINUATION_PATTERN.search(table.caption)
+    ):
         return True
 
     return False
@@ -58,23 +61,33 @@ def _check_header_similarity(cols1: list, cols2: list) -> bool:
         return False
 
     # Try Level 2 (fuzzy matching) if available
-    try:
-        from rapidfuzz import fuzz
-
-        # Fuzzy header matching
-        similarities = [
-            fuzz.token_set_ratio(str(c1), str(c2))
-            for c1, c2 in zip(cols1, cols2)
-        ]
-        avg_sim = sum(similarities) / len(similarities)
-        return avg_sim > 80  # 80% threshold
-
-    except ImportError:
-        # Level 1: Exact match (case-insensitive)
-        return all(
-            str(c1).lower().strip() == str(c2).lower().strip()
-            for c1, c2 in zip(cols1, cols2)
-        )
+    if _fuzz is not None:
+        # Identical headers score 100 per column, so skip the scorer. Not
+        # for blank headers: token_set_ratio scores two blank strings 0.
+        if cols1 == cols2 and all(str(c).split() for c in cols1):
+            return True
+
+        # Fuzzy header matching: average similarity must exceed 80%.
+        # Work in totals so we can stop once the remaining columns (at most
+        # 100 each) can no longer lift the average over the threshold.
+        required = 80 * len(cols1)
+        remaining = 100 * len(cols1)
+        total = 0.0
+        for c1, c2 in zip(cols1, cols2):
+            remaining -= 100
+            # Scores below this cutoff fail the check whatever follows, so
+            # rapidfuzz may return 0 for them without changing the result
+            cutoff = max(0.0, required - total - remaining)
+            total += _fuzz.token_set_ratio(str(c1), str(c2), score_cutoff=cutoff)
+            if total + remaining <= required:
+                return False
+        return total > required
+
+    # Level 1: Exact match (case-insensitive)
+    return all(
+        str(c1).lower().strip() == str(c2).lower().strip()
+        for c1, c2 in zip(cols1, cols2)
+    )
 
 
 def should_merge_bare_caption(
@@ -101,31 +114,18 @@ def should_merge_bare_caption(
     # Merge if column count matches (even if headers don't match)
     # This handles tables without header rows where first data row was used as headers
     if current_table.caption is None or (isinstance(current_table.caption, str) and not current_table.caption.strip()):
-        # Level 1: Column count must match
-        prev_cols = list(prev_table.dataframe.columns)
-        curr_cols = list(current_table.dataframe.columns)
-
-        if len(prev_cols) != len(curr_cols):
-            return False
-
-        # First try header similarity check
-        if _check_header_similarity(prev_cols, curr_cols):
-            return True
-
-        # If headers don't match but column count does,
-        # this might be a table without headers where data became headers
-        # Merge anyway since it's likely a continuation
-        return True
+        # Level 1: Column count must match. Headers are not compared: if
+        # they don't match, this might be a table without headers where
+        # data became headers, so merge anyway since it's likely a
+        # continuation
+        return prev_table.column_count == current_table.column_count
 
     # Case 2: Table with bare caption (just "Table N")
     # Must have bare caption metadata
-    if not hasattr(current_table, '_is_bare_caption') or not current_table._is_bare_caption:
+    if not current_table._is_bare_caption:
         return False
 
     # Must have table numbers
-    if not hasattr(prev_table, '_table_number') or not hasattr(current_table, '_table_number'):
-        return False
-
     prev_num = prev_table._table_number
     curr_num = current_table._table_number
 
@@ -145,14 +145,14 @@ def should_merge_bare_caption(
         return False
 
     # Level 1: Column count must match
-    prev_cols = list(prev_table.dataframe.columns)
-    curr_cols = list(current_table.dataframe.columns)
-
-    if len(prev_cols) != len(curr_cols):
+    if prev_table.column_count != current_table.column_count:
         return False
 
     # Check header similarity
-    return _check_header_similarity(prev_cols, curr_cols)
+    return _check_header_similarity(
+        list(prev_table.dataframe.columns),
+        list(current_table.dataframe.columns),
+    )
 
 
 def should_merge_tables(
@@ -178,6 +178,9 @@ def should_merge_tables(
         return False
     
     if strategy == TableMergeStrategy.IDENTICAL_HEADERS:
+        # Cheap reject before building header lists for comparison
+        if table1.column_count != table2.column_count:
+            return False
         h1 = list(table1.dataframe.columns)
         h2 = list(table2.dataframe.columns)
         return headers_match(h1, h2)
@@ -189,60 +192,117 @@ def should_merge_tables(
     return False
 
 
-def merge_two_tables(
-    table1: ExtractedTable,
-    table2: ExtractedTable,
-) -> ExtractedTable:
-    """Merge two tables into one.
+def _continuation_frames(
+    columns: pd.Index,
+    table: ExtractedTable,
+) -> list[pd.DataFrame]:
+    """Return a continuation table's rows aligned to the merged table columns.
 
-    Uses the first table's caption and combines rows.
-    Handles cases where table2 has different headers (e.g., no header row).
+    Handles cases where the continuation has different headers (e.g., no
+    header row).
 
-    CRITICAL: When table2 has no caption and different headers, the headers
-    are actually data that was misinterpreted. We recover this lost row.
+    CRITICAL: When the table has no caption and different headers, the
+    headers are actually data that was misinterpreted. We recover this lost
+    row.
 
     Args:
-        table1: Base table
-        table2: Continuation table
+        columns: Columns of the table merged so far
+        table: Continuation table
 
     Returns:
-        Merged table
+        Frames to append, in order
     """
-    df1 = table1.dataframe.copy()
-    df2 = table2.dataframe.copy()
+    df = table.dataframe
 
     # If column counts match but headers don't, this might be a headerless table
     # where the first data row was used as headers
-    if len(df1.columns) == len(df2.columns) and list(df1.columns) != list(df2.columns):
-        # Check if table2 has no caption (headerless table indicator)
+    if len(columns) == len(df.columns) and not columns.equals(df.columns):
+        # Check if table has no caption (headerless table indicator)
         is_headerless = (
-            table2.caption is None or
-            (isinstance(table2.caption, str) and not table2.caption.strip())
+            table.caption is None or
+            (isinstance(table.caption, str) and not table.caption.strip())
         )
 
+        # Align column names (set_axis returns a new frame, leaving the
+        # input table untouched)
+        aligned = df.set_axis(columns, axis=1)
+
         if is_headerless:
             # RECOVER LOST ROW: The "headers" are actually data!
             # Insert them as the first row
-            lost_row = pd.DataFrame([df2.columns], columns=df1.columns)
-            df2.columns = df1.columns  # Align column names
-            df2 = pd.concat([lost_row, df2], ignore_index=True)
-        else:
-            # Normal case: just rename columns
-            df2.columns = df1.columns
+            lost_row = pd.DataFrame([df.columns], columns=columns)
+            return [lost_row, aligned]
+
+        # Normal case: just rename columns
+        return [aligned]
+
+    return [df]
+
+
+def _merged_columns(columns: pd.Index, frames: list[pd.DataFrame]) -> pd.Index:
+    """Columns of the merged table after appending `frames`.
+
+    Equal to the base columns unless a continuation has a different column
+    count (possible under COMPATIBLE_COLUMNS), in which case `pd.concat`
+    takes the union. Computed on zero-row frames so no data is copied.
+    """
+    if all(frame.columns.equals(columns) for frame in frames):
+        return columns
+    empty = [pd.DataFrame(columns=columns), *(frame.head(0) for frame in frames)]
+    return pd.concat(empty, ignore_index=True).columns
+
+
+def _merge_run(tables: list[ExtractedTable]) -> ExtractedTable:
+    """Merge a run of continuation tables into one.
+
+    Uses the first table's caption and columns, and concatenates all rows
+    with a single `pd.concat` rather than re-copying the accumulated rows
+    for every continuation.
+
+    Args:
+        tables: Base table followed by its continuations
+
+    Returns:
+        Merged table
+    """
+    base = tables[0]
+    columns = base.dataframe.columns
 
-    # Concatenate dataframes
-    merged_df = pd.concat([df1, df2], ignore_index=True)
+    frames = [base.dataframe]
+    for table in tables[1:]:
+        new_frames = _continuation_frames(columns, table)
+        frames.extend(new_frames)
+        columns = _merged_columns(columns, new_frames)
 
     return ExtractedTable(
-        dataframe=merged_df,
-        caption=table1.caption,  # Keep original caption
-        start_line=table1.start_line,
-        end_line=table2.end_line,
-        raw_markdown=table1.raw_markdown + "\n\n" + table2.raw_markdown,
+        dataframe=pd.concat(frames, ignore_index=True),
+        caption=base.caption,  # Keep original caption
+        start_line=base.start_line,
+        end_line=tables[-1].end_line,
+        raw_markdown="\n\n".join(t.raw_markdown for t in tables),
         is_continuation=False,
     )
 
 
+def merge_two_tables(
+    table1: ExtractedTable,
+    table2: ExtractedTable,
+) -> ExtractedTable:
+    """Merge two tables into one.
+
+    Uses the first table's caption and combines rows.
+    Handles cases where table2 has different headers (e.g., no header row).
+
+    Args:
+        table1: Base table
+        table2: Continuation table
+
+    Returns:
+        Merged table
+    """
+    return _merge_run([table1, table2])
+
+
 def merge_tables(
     tables: list[ExtractedTable],
     strategy: TableMergeStrategy = TableMergeStrategy.IDENTICAL_HEADERS,
@@ -262,216 +322,32 @@ def merge_tables(
         return tables
 
     result: list[ExtractedTable] = []
+    run = [tables[0]]
     current = tables[0]
 
     for next_table in tables[1:]:
-        # Check for bare caption merging first (higher priority)
-        if should_merge_bare_caption(current, next_table):
-            current = merge_two_tables(current, next_table)
-        # Then check normal merge strategy
-        elif should_merge_tables(current, next_table, strategy):
-            current = merge_two_tables(current, next_table)
+        # Check for bare caption merging first (higher priority),
+        # then the normal merge strategy
+        if (
+            should_merge_bare_caption(current, next_table)
+            or should_merge_tables(current, next_table, strategy)
+        ):
+            run.append(next_table)
+            # Rows are only concatenated once the run ends. Later checks
+            # compare against a stand-in that looks like the merged table:
+            # first caption, merged columns, no bare-caption metadata.
+            df = current.dataframe
+            columns = _merged_columns(
+                df.columns, _continuation_frames(df.columns, next_table)
+            )
+            current = ExtractedTable(
+                dataframe=df if columns is df.columns else pd.DataFrame(columns=columns),
+                caption=run[0].caption,
+            )
         else:
-            result.append(current)
+            result.append(run[0] if len(run) == 1 else _merge_run(run))
+            run = [next_table]
             current = next_table
 
-    result.append(current)
+    result.append(run[0] if len(run) == 1 else _merge_run(run))
     return result
-
-
-# ============================================================================
-# MARIMO NOTEBOOK (interactive documentation)
-# ============================================================================
-
-app = marimo.App(width="medium")
-
-
-@app.cell
-def _():
-    import marimo as mo
-    import pandas as pd
-    from markdown_table_extractor.core.merger import (
-        CONTINUATION_PATTERN,
-        is_continuation_table,
-        should_merge_tables,
-        merge_tables,
-        merge_two_tables,
-    )
-    from markdown_table_extractor.core.models import ExtractedTable, TableMergeStrategy
-    return (mo, pd, CONTINUATION_PATTERN, is_continuation_table, should_merge_tables, merge_tables, merge_two_tables, ExtractedTable, TableMergeStrategy)
-
-
-@app.cell
-def _(mo):
-    mo.md("# Table Merger")
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `is_continuation_table(table: ExtractedTable) -> bool`
-
-    Check if a table has a continuation marker like "(Continued)" or "(Cont.)".
-    """)
-    return
-
-
-@app.cell
-def _(mo, pd, ExtractedTable, is_continuation_table):
-    # Example 1: Table with continuation marker
-    _cont_table = ExtractedTable(
-        dataframe=pd.DataFrame({"Name": ["Carol"], "Score": [92]}),
-        caption="Table 1 (Continued)",
-        is_continuation=True
-    )
-
-    # Example 2: Regular table
-    _regular_table = ExtractedTable(
-        dataframe=pd.DataFrame({"Name": ["Alice"], "Score": [95]}),
-        caption="Table 2. Results"
-    )
-
-    _is_cont1 = is_continuation_table(_cont_table)
-    _is_cont2 = is_continuation_table(_regular_table)
-
-    mo.vstack([
-        mo.md(f"**Table 1:** `{_cont_table.caption}` → `{_is_cont1}`"),
-        mo.md(f"**Table 2:** `{_regular_table.caption}` → `{_is_cont2}`"),
-    ])
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `merge_two_tables(table1, table2) -> ExtractedTable`
-
-    Combine two tables into one, preserving the first table's caption.
-    """)
-    return
-
-
-@app.cell
-def _(mo, pd, ExtractedTable, merge_two_tables):
-    # Create two tables to merge
-    _t1 = ExtractedTable(
-        dataframe=pd.DataFrame({"ID": [1, 2], "Name": ["Alice", "Bob"]}),
-        caption="Table 1. Data"
-    )
-    _t2 = ExtractedTable(
-        dataframe=pd.DataFrame({"ID": [3, 4], "Name": ["Carol", "Dave"]}),
-        caption="Table 1 (Continued)",
-        is_continuation=True
-    )
-
-    _merged = merge_two_tables(_t1, _t2)
-
-    mo.vstack([
-        mo.md("**Before merging:**"),
-        mo.md(f"- Table 1: {_t1.row_count} rows"),
-        mo.md(f"- Table 2: {_t2.row_count} rows"),
-        mo.md("**After merging:**"),
-        mo.ui.table(_merged.dataframe, selection=None),
-        mo.callout(f"Merged into {_merged.row_count} total rows", kind="success"),
-    ])
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ---
-
-    ## 🔗 Comprehensive Merge Demo
-    """)
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("## 🔍 Continuation Detection Demo")
-    return
-
-
-@app.cell
-def _(mo, CONTINUATION_PATTERN):
-    # Test continuation patterns with visual output
-    _test_captions = [
-        ("Table 3. Results", "Regular table caption"),
-        ("Table 3 (Continued)", "Standard continuation marker"),
-        ("Table 3 (cont.)", "Abbreviated continuation"),
-        ("Table 3 - cont'd", "Alternative continuation format"),
-        ("Table 4. Data Summary", "Another regular caption"),
-    ]
-
-    _results = []
-    for caption, description in _test_captions:
-        _is_cont = bool(CONTINUATION_PATTERN.search(caption))
-        _emoji = "🔗" if _is_cont else "📄"
-        _results.append(f"{_emoji} `{caption:35}` → **{_is_cont}** ({description})")
-
-    mo.md("\n\n".join(_results))
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## 🔗 Table Merging Demo
-
-    See how continuation tables are automatically merged into a single table.
-    """)
-    return
-
-
-@app.cell
-def _(mo, pd, ExtractedTable, merge_tables):
-    # Create sample tables with visual before/after
-    _df1 = pd.DataFrame({"ID": [1, 2], "Name": ["Alice", "Bob"], "Score": [95, 87]})
-    _df2 = pd.DataFrame({"ID": [3, 4], "Name": ["Carol", "Dave"], "Score": [92, 88]})
-
-    _t1 = ExtractedTable(_df1, caption="Table 1. Test Results")
-    _t2 = ExtractedTable(_df2, caption="Table 1 (Continued)", is_continuation=True)
-
-    _merged = merge_tables([_t1, _t2])
-
-    mo.vstack([
-        mo.md("### Before Merging"),
-        mo.accordion({
-            "Table 1 (Original)": mo.vstack([
-                mo.md(f"**Caption:** `{_t1.caption}`"),
-                mo.md(f"**Rows:** {_t1.row_count}, **Columns:** {_t1.column_count}"),
-                mo.ui.table(_t1.dataframe),
-            ]),
-            "Table 2 (Continuation)": mo.vstack([
-                mo.md(f"**Caption:** `{_t2.caption}`"),
-                mo.md(f"**Is Continuation:** {_t2.is_continuation} ✓"),
-                mo.md(f"**Rows:** {_t2.row_count}, **Columns:** {_t2.column_count}"),
-                mo.ui.table(_t2.dataframe),
-            ]),
-        }),
-
-        mo.md("### After Merging"),
-        mo.callout(
-            f"Merged **2 tables** into **1 table** with **{_merged[0].row_count} total rows**",
-            kind="success"
-        ),
-        mo.ui.table(_merged[0].dataframe),
-
-        mo.md("### Merge Details"),
-        mo.accordion({
-            "Final Table Info": mo.md(f"""
-            - **Caption:** `{_merged[0].caption}`
-            - **Total Rows:** {_merged[0].row_count}
-            - **Columns:** {_merged[0].column_count}
-            - **Is Continuation:** {_merged[0].is_continuation}
-            - **Original Tables:** 2 → 1
-            """),
-        }),
-    ])
-    return
-
-
-if __name__ == "__main__":
-    app.run()
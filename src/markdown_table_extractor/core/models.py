@@ -4,7 +4,6 @@ This module defines the core data structures used throughout the library.
 """
 from __future__ import annotations
 
-import marimo
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Iterator, Optional
@@ -12,10 +11,6 @@ from typing import Iterator, Optional
 import pandas as pd
 
 
-# ============================================================================
-# MODULE-LEVEL CODE (importable)
-# ============================================================================
-
 
 class TableMergeStrategy(Enum):
     """Strategy for merging adjacent tables.
@@ -50,6 +45,13 @@ class ExtractedTable:
     end_line: int = 0
     raw_markdown: str = ""
     is_continuation: bool = False
+    # Caption metadata set by the extractor for bare-caption merging
+    _table_number: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _is_bare_caption: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
 
     @property
     def column_count(self) -> int:
@@ -104,108 +106,3 @@ class ExtractionResult:
         error_str = f", errors={len(self.errors)}" if self.errors else ""
         merged_str = f", merged={self.merged_count}" if self.merged_count else ""
         return f"ExtractionResult(tables={len(self.tables)}{merged_str}{error_str})"
-
-
-# ============================================================================
-# MARIMO NOTEBOOK (interactive documentation)
-# ============================================================================
-
-app = marimo.App(width="medium")
-
-
-@app.cell
-def _():
-    import marimo as mo
-    import pandas as pd
-    from markdown_table_extractor.core.models import (
-        ExtractedTable,
-        ExtractionResult,
-        TableMergeStrategy,
-    )
-    return (mo, pd, ExtractedTable, ExtractionResult, TableMergeStrategy)
-
-
-@app.cell
-def _(mo):
-    mo.md("# Data Models")
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `TableMergeStrategy` (Enum)
-
-    Controls how continuation tables are merged.
-    """)
-    return
-
-
-@app.cell
-def _(mo, TableMergeStrategy):
-    mo.vstack([
-        mo.md("**Available strategies:**"),
-        mo.md(f"- `NONE` = `{TableMergeStrategy.NONE.value}` - Don't merge any tables"),
-        mo.md(f"- `IDENTICAL_HEADERS` = `{TableMergeStrategy.IDENTICAL_HEADERS.value}` - Merge if headers match"),
-        mo.md(f"- `COMPATIBLE_COLUMNS` = `{TableMergeStrategy.COMPATIBLE_COLUMNS.value}` - Merge if columns within ±2"),
-    ])
-    return
-
-
-@app.cell
-def _(mo):
-    mo.md("""
-    ## `ExtractedTable` (dataclass)
-
-    Represents a single extracted table with metadata.
-    """)
-    return
-
-
-@app.cell
-def _(mo, pd, ExtractedTable):
-    # Live demo - create an ExtractedTable instance
-    _demo_df = pd.DataFrame({"Name": ["Alice", "Bob"], "Score": [95, 87]})
-    _demo_table = ExtractedTable(
-        dataframe=_demo_df,
-        caption="Table 1. Test Scores",
-        start_line=5,
-        end_line=7,
-        raw_markdown="| Name | Score |\n|------|-------|\n| Alice | 95 |\n| Bob | 87 |",
-        is_continuation=False,
-    )
-
-    mo.vstack([
-        mo.md("## 📋 ExtractedTable Example"),
-        mo.md("**Creating an ExtractedTable instance:**"),
-        mo.md("""
-        ```python
-        table = ExtractedTable(
-            dataframe=df,
-            caption="Table 1. Test Scores",
-            start_line=5,
-            end_line=7,
-            is_continuation=False
-        )
-        ```
-        """),
-        mo.md("**Table Data:**"),
-        mo.ui.table(_demo_table.dataframe, selection=None),
-        mo.md("**Table Properties:**"),
-        mo.accordion({
-            "Metadata": mo.md(f"""
-            - **Caption:** `{_demo_table.caption}`
-            - **Rows:** {_demo_table.row_count}
-            - **Columns:** {_demo_table.column_count}
-            - **Start Line:** {_demo_table.start_line}
-            - **End Line:** {_demo_table.end_line}
-            - **Is Continuation:** {_demo_table.is_continuation}
-            """),
-            "Raw Markdown": mo.md(f"```markdown\n{_demo_table.raw_markdown}\n```"),
-        }),
-    ])
-    return
-
-
-if __name__ == "__main__":
-    app.run()
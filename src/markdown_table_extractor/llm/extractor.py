@@ -20,7 +20,7 @@ Import directly:
 from __future__ import annotations
 
 import marimo
-import json
+import functools
 from typing import Optional
 from dataclasses import dataclass
 import pandas as pd
@@ -30,6 +30,7 @@ from markdown_table_extractor.core.models import (
     ExtractedTable,
     ExtractionResult,
 )
+from markdown_table_extractor.core.parser import CONTINUATION_PATTERN
 
 # Pydantic for structured output schemas
 from pydantic import BaseModel, Field
@@ -42,6 +43,9 @@ app = marimo.App(width="medium")
 # SETUP CELL
 # =============================================================================
 with app.setup:
+    # Decorators on @app.function cells resolve in the setup namespace
+    import functools
+
     import marimo as mo
 
 
@@ -207,6 +211,20 @@ def _():
     return
 
 
+@app.function
+@functools.lru_cache(maxsize=16)
+def _get_model(model_id: str):
+    """Resolve an `llm` model, once per model ID.
+
+    `llm.get_model` walks every installed plugin to build the model
+    registry on each call, so reuse the resolved model across documents.
+    Unknown IDs raise and are not cached.
+    """
+    import llm
+
+    return llm.get_model(model_id)
+
+
 @app.function
 def extract_with_llm(
     text: str,
@@ -246,16 +264,15 @@ def extract_with_llm(
     prompt_text = system_prompt or SYSTEM_PROMPT
     
     try:
-        model = llm.get_model(model_id)
+        model = _get_model(model_id)
         
         response = model.prompt(
             f"{prompt_text}\n\n---\n\nExtract tables from:\n\n{text}",
             schema=LLMExtractionResponse
         )
         
-        # Parse the structured response
-        response_data = json.loads(response.text())
-        llm_result = LLMExtractionResponse(**response_data)
+        # Parse and validate the structured response in one pass
+        llm_result = LLMExtractionResponse.model_validate_json(response.text())
         
         # Convert to our internal format
         for llm_table in llm_result.tables:
@@ -264,7 +281,10 @@ def extract_with_llm(
                 table = ExtractedTable(
                     dataframe=df,
                     caption=llm_table.caption,
-                    is_continuation="continued" in (llm_table.caption or "").lower()
+                    is_continuation=bool(
+                        llm_table.caption
+                        and CONTINUATION_PATTERN.search(llm_table.caption)
+                    ),
                 )
                 result.tables.append(table)
         
@@ -364,8 +384,9 @@ def extract_tables_hybrid(
     """
     from markdown_table_extractor.core.extractor import extract_markdown_tables
     
-    # Try regex first
-    result = extract_markdown_tables(text)
+    # Try regex first. Without a pipe there is no markdown table for it
+    # to find, so go straight to the LLM decision.
+    result = extract_markdown_tables(text) if "|" in text else ExtractionResult()
     
     # Check if we should fall back to LLM
     use_llm = False
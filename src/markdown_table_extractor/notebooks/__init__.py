@@ -0,0 +1 @@
+"""marimo notebooks documenting the core modules (not imported by the library)."""
@@ -0,0 +1,198 @@
+"""Interactive documentation for data cleaning utilities.
+
+marimo notebook demonstrating `markdown_table_extractor.core.cleaner`.
+Kept separate from the library module so importing the package does not
+pull in marimo.
+
+Usage:
+    uv run marimo edit src/markdown_table_extractor/notebooks/cleaner.py
+"""
+import marimo
+
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+    import pandas as pd
+    from markdown_table_extractor.core.cleaner import (
+        clean_column_name,
+        clean_value,
+        headers_match,
+        normalize_headers,
+        merge_sub_header,
+    )
+    return (mo, pd, clean_column_name, clean_value, headers_match, normalize_headers, merge_sub_header)
+
+
+@app.cell
+def _(mo):
+    mo.md("# Data Cleaning Utilities")
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `clean_column_name(name: str) -> str`
+
+    Remove HTML tags and normalize whitespace in column names.
+    """)
+    return
+
+
+@app.cell
+def _(mo, clean_column_name):
+    # Examples showing HTML cleaning
+    _examples = [
+        "Column<br>Name",
+        "Patient&nbsp;ID",
+        "Age<br>(years)",
+    ]
+
+    _cleaned = [clean_column_name(ex) for ex in _examples]
+
+    mo.vstack([
+        mo.md("**Before → After:**"),
+        *[mo.md(f"- `{before}` → `{after}`") for before, after in zip(_examples, _cleaned)],
+        mo.callout(f"Cleaned {len(_examples)} column names", kind="success")
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `clean_value(value: str) -> str`
+
+    Clean cell values by removing HTML and normalizing whitespace.
+    """)
+    return
+
+
+@app.cell
+def _(mo, clean_value):
+    _value = "Data<br>with&nbsp;HTML"
+    _cleaned_val = clean_value(_value)
+
+    mo.vstack([
+        mo.md(f"**Input:** `{_value}`"),
+        mo.md(f"**Output:** `{_cleaned_val}`"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `headers_match(h1, h2, threshold=0.8) -> bool`
+
+    Check if two header lists are similar enough to merge.
+    """)
+    return
+
+
+@app.cell
+def _(mo, headers_match):
+    # Test cases
+    _h1 = ["Name", "Age", "City"]
+    _h2_same = ["name", "age", "city"]  # Case different
+    _h3_diff = ["Name", "Age", "Location"]  # One column different
+
+    _match1 = headers_match(_h1, _h2_same)
+    _match2 = headers_match(_h1, _h3_diff)
+
+    mo.vstack([
+        mo.md(f"`{_h1}` vs `{_h2_same}` → **{_match1}** (case-insensitive match)"),
+        mo.md(f"`{_h1}` vs `{_h3_diff}` → **{_match2}** (one column different)"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ---
+
+    ## 🧹 Comprehensive Cleaning Demo
+    """)
+    return
+
+
+@app.cell
+def _(mo, clean_column_name, clean_value, pd):
+    # Test HTML cleaning with before/after visualization
+    _dirty_examples = [
+        ("Column<br>Name", "Column header with line break"),
+        ("Patient&nbsp;ID", "Header with non-breaking space"),
+        ("Age<br>(years)", "Header with parenthetical"),
+        ("Group&nbsp;A<br>n=50", "Complex header with HTML entities"),
+    ]
+
+    _results = []
+    for dirty_text, description in _dirty_examples:
+        _cleaned = clean_column_name(dirty_text)
+        _results.append({
+            "Description": description,
+            "Before": dirty_text,
+            "After": _cleaned,
+            "Cleaned": "✅" if dirty_text != _cleaned else "—"
+        })
+
+    _clean_df = pd.DataFrame(_results)
+
+    mo.vstack([
+        mo.md("### Before & After Cleaning"),
+        mo.ui.table(_clean_df, selection=None),
+        mo.callout(
+            f"Cleaned {len([r for r in _results if r['Cleaned'] == '✅'])} out of {len(_results)} examples",
+            kind="success"
+        )
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("## 🔀 Header Matching Demo")
+    return
+
+
+@app.cell
+def _(mo, headers_match, pd):
+    # Test header matching with visual comparison
+    _header_tests = [
+        (["Name", "Age", "City"], ["name", "age", "city"], "Case-insensitive", True),
+        (["Name", "Age", "City"], ["Name", "Age", "Location"], "One different", False),
+        (["ID", "Patient Name", "Score"], ["ID", "Patient Name", "Score"], "Exact match", True),
+        (["Column A", "Column B"], ["Column A", "Column C"], "50% match", False),
+    ]
+
+    _comparison_data = []
+    for h1, h2, desc, expected in _header_tests:
+        _match = headers_match(h1, h2)
+        _emoji = "✅" if _match else "❌"
+        _comparison_data.append({
+            "Test": desc,
+            "Headers 1": str(h1),
+            "Headers 2": str(h2),
+            "Match": _emoji + (" Yes" if _match else " No"),
+            "Expected": "✅" if _match == expected else "⚠️"
+        })
+
+    _match_df = pd.DataFrame(_comparison_data)
+
+    mo.vstack([
+        mo.md("### Header Comparison Results"),
+        mo.ui.table(_match_df, selection=None),
+        mo.callout(
+            "Headers are matched using normalized comparison (case-insensitive, cleaned)",
+            kind="info"
+        )
+    ])
+    return
+
+
+if __name__ == "__main__":
+    app.run()
@@ -0,0 +1,226 @@
+"""Interactive documentation for the main extraction API.
+
+marimo notebook demonstrating `markdown_table_extractor.core.extractor`.
+Kept separate from the library module so importing the package does not
+pull in marimo.
+
+Usage:
+    uv run marimo edit src/markdown_table_extractor/notebooks/extractor.py
+"""
+import marimo
+
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+    from markdown_table_extractor.core.extractor import (
+        extract_tables,
+        extract_markdown_tables,
+        extract_single_table,
+    )
+    return (mo, extract_tables, extract_markdown_tables, extract_single_table)
+
+
+@app.cell
+def _(mo):
+    mo.md("# Table Extractor")
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `extract_tables(text: str) -> list[pd.DataFrame]`
+
+    **Simple API** - Returns just DataFrames.
+    """)
+    return
+
+
+@app.cell
+def _(mo, extract_tables):
+    _simple_md = """
+| Name | Score |
+|------|-------|
+| Alice | 95 |
+| Bob | 87 |
+"""
+
+    _tables = extract_tables(_simple_md)
+
+    mo.vstack([
+        mo.md("**Input markdown:**"),
+        mo.md(_simple_md),
+        mo.md("**Extracted DataFrame:**"),
+        mo.ui.table(_tables[0], selection=None),
+        mo.callout(f"Extracted {len(_tables)} table(s)", kind="success"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `extract_markdown_tables(text, ...) -> ExtractionResult`
+
+    **Full API** - Returns tables with metadata (captions, line numbers, etc.).
+    """)
+    return
+
+
+@app.cell
+def _(mo, extract_markdown_tables):
+    _full_md = """
+Table 1. Test Results
+
+| Name | Score |
+|------|-------|
+| Alice | 95 |
+"""
+
+    _result = extract_markdown_tables(_full_md)
+
+    mo.vstack([
+        mo.md("**Extracted with metadata:**"),
+        mo.md(f"- Caption: `{_result[0].caption}`"),
+        mo.md(f"- Rows: {_result[0].row_count}, Columns: {_result[0].column_count}"),
+        mo.ui.table(_result[0].dataframe, selection=None),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ---
+
+    ## 🎯 End-to-End Demo with Continuation Tables
+    """)
+    return
+
+
+@app.cell
+def _(mo):
+    sample_markdown = """
+# Sample Document
+
+Table 1. Test Results
+
+| Name | Score | Grade |
+|------|-------|-------|
+| Alice | 95 | A |
+| Bob | 87 | B |
+| Carol | 92 | A |
+
+Some text between tables.
+
+Table 2. Summary
+
+| Metric | Value |
+|--------|-------|
+| Mean | 91.3 |
+| Median | 92 |
+"""
+
+    mo.vstack([
+        mo.md("### Input Markdown"),
+        mo.md(f"```markdown\n{sample_markdown}\n```"),
+    ])
+    return (sample_markdown,)
+
+
+@app.cell
+def _(mo, extract_markdown_tables, sample_markdown):
+    # Extract tables with full visualization
+    _result = extract_markdown_tables(sample_markdown)
+
+    mo.vstack([
+        mo.md("### Extraction Results"),
+        mo.callout(
+            f"Found **{len(_result)} tables** | Errors: {len(_result.errors)} | Merged: {_result.merged_count}",
+            kind="success" if not _result.has_errors else "warn"
+        ),
+
+        mo.md("### Extracted Tables"),
+        mo.accordion({
+            f"Table {i+1}: {table.caption}": mo.vstack([
+                mo.md(f"""
+                **Table Information:**
+                - Caption: `{table.caption}`
+                - Rows: {table.row_count}
+                - Columns: {table.column_count}
+                - Lines: {table.start_line}–{table.end_line}
+                """),
+                mo.md("**Data:**"),
+                mo.ui.table(table.dataframe),
+            ])
+            for i, table in enumerate(_result.tables)
+        }),
+    ])
+    return (_result,)
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## 📊 Complex Example: Continuation Tables
+
+    Demonstration of automatic table merging with continuation markers.
+    """)
+    return
+
+
+@app.cell
+def _(mo, extract_markdown_tables):
+    _complex_md = """
+Table 3. Patient Demographics
+
+| ID | Name  | Age | Gender |
+|----|-------|-----|--------|
+| 1  | Alice | 45  | F      |
+| 2  | Bob   | 52  | M      |
+
+Table 3 (Continued)
+
+| ID | Name  | Age | Gender |
+|----|-------|-----|--------|
+| 3  | Carol | 38  | F      |
+| 4  | Dave  | 61  | M      |
+"""
+
+    _complex_result = extract_markdown_tables(_complex_md)
+
+    mo.vstack([
+        mo.md("### Input (Two Tables with Continuation Marker)"),
+        mo.md(f"```markdown\n{_complex_md}\n```"),
+
+        mo.md("### Output (Automatically Merged)"),
+        mo.callout(
+            f"Merged **{_complex_result.merged_count} continuation table** → Result: **{len(_complex_result)} table** with **{_complex_result[0].row_count} total rows**",
+            kind="success"
+        ),
+
+        mo.ui.table(_complex_result[0].dataframe),
+
+        mo.md("### How It Works"),
+        mo.accordion({
+            "Detection": mo.md("""
+            1. **Caption Detection**: Found "Table 3 (Continued)" marker
+            2. **Header Matching**: Verified columns match previous table
+            3. **Auto-Merge**: Combined into single DataFrame
+            """),
+            "Configuration": mo.md("""
+            You can control merging behavior with `merge_strategy`:
+            - `IDENTICAL_HEADERS` (default) - Merge if headers match
+            - `COMPATIBLE_COLUMNS` - Merge if column counts ±2
+            - `NONE` - Don't merge, keep separate
+            """),
+        }),
+    ])
+    return
+
+
+if __name__ == "__main__":
+    app.run()
@@ -0,0 +1,736 @@
+import marimo
+
+__generated_with = "0.18.1"
+app = marimo.App(width="full")
+
+with app.setup:
+    # Static page content, defined once at import so reruns only rewrap it
+    HOME_INTRO_MD = """
+    # 📊 Markdown Table Extractor
+
+    > A Python library for extracting structured data from markdown tables,
+    > designed for processing academic manuscripts and complex documents.
+    """
+
+    HOME_CALLOUT_MD = """
+    **✨ Each module is an interactive marimo notebook** - you can run
+    them as both documentation and executable code!
+    """
+
+    FEATURES_MD = {
+        "🎯 Smart Table Detection": """
+        - Handles complex alignment syntax (`:--:`, `---:`, `:---`)
+        - Detects separator rows accurately
+        - Parses headers and data rows intelligently
+        """,
+        "🔗 Continuation Tables": """
+        - Automatically merges tables marked as "(Continued)"
+        - Three merge strategies available (NONE, IDENTICAL_HEADERS, COMPATIBLE_COLUMNS)
+        - Preserves captions and metadata during merging
+        """,
+        "🧹 HTML Cleaning": """
+        - Removes `<br>` tags and other HTML artifacts
+        - Normalizes whitespace
+        - Cleans column names and cell values
+        """,
+        "📑 Advanced Features": """
+        - **Multi-level Headers** - Supports sub-header rows
+        - **Caption Detection** - Finds patterns like "Table 3. Results"
+        - **Export Formats** - CSV, JSON, Excel via pandas
+        - **Type Hints** - Full type annotations for IDE support
+        """,
+    }
+
+    ARCHITECTURE_MD = """
+    ## Architecture
+
+    The library uses a **modular pipeline architecture**:
+
+    ```
+    Parser → Cleaner → Merger → Extractor
+       ↑                            ↓
+    Models ←──────────────────────────
+    ```
+
+    Each component is independent and testable.
+    """
+
+    # (route, lucide icon, label) for the top navigation menu
+    NAV_PAGES = (
+        ("#/", "lucide:home", "Home"),
+        ("#/quick-start", "lucide:zap", "Quick Start"),
+        ("#/modules", "lucide:package", "Modules"),
+        ("#/examples", "lucide:code", "Examples"),
+        ("#/api", "lucide:book-open", "API"),
+    )
+
+    # Sample documents for the Quick Start and Examples pages
+    EMPLOYEE_DIRECTORY_MD = """
+# Employee Directory
+
+Below is our current employee roster with location information:
+
+| Name  | Age | City     |
+|-------|-----|----------|
+| Alice | 30  | New York |
+| Bob   | 25  | London   |
+
+Updated as of Q4 2025.
+"""
+
+    ACADEMIC_TABLE_MD = """
+# Clinical Trial Results
+
+This study examined the efficacy of a new treatment protocol across two patient groups.
+Baseline demographic characteristics were collected for all participants to ensure
+comparable populations.
+
+**Table 1. Patient Demographics**
+
+| Variable | Group A<br>n=50 | Group B<br>n=45 |
+|----------|-----------------|-----------------|
+| Age (years) | 45.2 ± 3.1 | 47.8 ± 2.9 |
+| Male/Female | 28/22 | 25/20 |
+
+The groups showed no significant differences in baseline characteristics (p > 0.05).
+Statistical analysis was performed using two-tailed t-tests with α = 0.05.
+"""
+
+    ALIGNED_TABLE_MD = """
+# Data Formatting Guide
+
+Tables can use different alignment markers for left, center, and right alignment.
+This example demonstrates all three:
+
+| Left | Center | Right |
+|:-----|:------:|------:|
+| L1   | C1     | R1    |
+| L2   | C2     | R2    |
+
+Alignment markers (`:---`, `:---:`, `---:`) are detected and handled correctly.
+"""
+
+    # Multi-page sample shared by the Quick Start snippet and the Examples page
+    CONTINUED_TABLES_MD = """
+# Longitudinal Study Results
+
+We conducted a 6-month study tracking participant outcomes across multiple time points.
+The following table presents the complete dataset, which spans multiple pages in the
+original manuscript.
+
+Table 2. Results Summary
+
+| ID | Name  | Score |
+|----|-------|-------|
+| 1  | Alice | 95    |
+| 2  | Bob   | 87    |
+
+The table continues on the next page with additional participants.
+
+Table 2 (Continued)
+
+| ID | Name  | Score |
+|----|-------|-------|
+| 3  | Carol | 92    |
+| 4  | Dave  | 88    |
+
+All participants completed the study protocol without adverse events.
+"""
+
+    CONTINUATION_SNIPPET = (
+        f'markdown_text = """{CONTINUED_TABLES_MD}"""\n'
+        "\n"
+        "result = extract_markdown_tables(markdown_text)\n"
+        'print(f"Tables: {len(result)}")  # 1 (auto-merged!)\n'
+        'print(f"Rows: {result[0].row_count}")  # 4'
+    )
+
+    INSTALL_COMMANDS = {
+        "pip": "pip install markdown-table-extractor",
+        "uv": "uv pip install markdown-table-extractor",
+        "poetry": "poetry add markdown-table-extractor",
+    }
+
+    MODULES_CALLOUT_MD = """
+    Each module is an **interactive marimo notebook**. You can:
+    - 📖 Read the documentation
+    - 🔧 Modify and run the code
+    - 🧪 Experiment with live examples
+    """
+
+    # (tab label, file name, description, key functions, notebook command)
+    MODULES_SPEC = (
+        (
+            "🔍 Parser",
+            "parser.py",
+            "Detects and parses markdown table structures",
+            (
+                "is_separator_row(line) - Detects separator rows",
+                "is_table_row(line) - Checks if line is a table row",
+                "parse_table_row(line) - Extracts cell contents",
+                "detect_caption(lines, start) - Finds table captions",
+            ),
+            "uv run marimo edit src/markdown_table_extractor/notebooks/parser.py",
+        ),
+        (
+            "🧹 Cleaner",
+            "cleaner.py",
+            "Cleans column names and cell values",
+            (
+                "clean_column_name(name) - Removes HTML, normalizes whitespace",
+                "clean_value(value) - Cleans cell content",
+                "headers_match(h1, h2) - Fuzzy header comparison",
+                "normalize_headers(headers) - Prepares headers for comparison",
+            ),
+            "uv run marimo edit src/markdown_table_extractor/notebooks/cleaner.py",
+        ),
+        (
+            "🔗 Merger",
+            "merger.py",
+            "Merges continuation tables intelligently",
+            (
+                "is_continuation_table(table) - Detects continuation markers",
+                "should_merge_tables(t1, t2) - Determines merge eligibility",
+                "merge_tables(tables, strategy) - Merges all continuations",
+            ),
+            "uv run marimo edit src/markdown_table_extractor/notebooks/merger.py",
+        ),
+        (
+            "⚙️ Extractor",
+            "extractor.py",
+            "Main orchestration - ties everything together",
+            (
+                "extract_tables(text) - Simple API returning DataFrames",
+                "extract_markdown_tables(text) - Full API with metadata",
+                "extract_single_table(lines, start) - Extract one table",
+            ),
+            "uv run marimo edit src/markdown_table_extractor/notebooks/extractor.py",
+        ),
+        (
+            "📋 Models",
+            "models.py",
+            "Data classes and enums",
+            (
+                "ExtractedTable - Single table with metadata",
+                "ExtractionResult - Collection of tables",
+                "TableMergeStrategy - Enum for merge behavior",
+            ),
+            "uv run marimo edit src/markdown_table_extractor/notebooks/models.py",
+        ),
+    )
+
+    MODULE_CARD_TEMPLATE = (
+        "### {name}\n\n"
+        "{description}\n\n"
+        "**Key functions:**\n"
+        "{functions_list}\n\n"
+        "**Open interactively:**\n"
+        "```bash\n"
+        "{command}\n"
+        "```\n"
+    )
+
+    # Passed straight to mo.mermaid rather than through a markdown fence
+    MODULE_DEPENDENCIES_DIAGRAM = """graph TD
+    A[models.py] --> B[parser.py]
+    B --> C[cleaner.py]
+    C --> D[merger.py]
+    D --> E[extractor.py]
+    A --> E"""
+
+    API_MAIN_FUNCTIONS_MD = {
+        "extract_tables()": """
+        ```python
+        extract_tables(text: str) -> list[pd.DataFrame]
+        ```
+
+        **Simple API**: Extract tables and return DataFrames only.
+
+        **Parameters:**
+        - `text` (str): Markdown document text
+
+        **Returns:**
+        - `list[pd.DataFrame]`: List of extracted tables
+
+        **Example:**
+        ```python
+        from markdown_table_extractor import extract_tables
+        tables = extract_tables(markdown_text)
+        ```
+        """,
+        "extract_markdown_tables()": """
+        ```python
+        extract_markdown_tables(
+            text: str,
+            merge_strategy: TableMergeStrategy = IDENTICAL_HEADERS,
+            detect_captions: bool = True,
+            skip_sub_headers: bool = True
+        ) -> ExtractionResult
+        ```
+
+        **Full API**: Extract tables with complete metadata.
+
+        **Parameters:**
+        - `text` (str): Markdown document text
+        - `merge_strategy`: How to handle continuations
+          - `NONE`: Don't merge
+          - `IDENTICAL_HEADERS`: Merge if headers match (default)
+          - `COMPATIBLE_COLUMNS`: Merge if column counts ±2
+        - `detect_captions` (bool): Look for table captions
+        - `skip_sub_headers` (bool): Merge sub-header rows
+
+        **Returns:**
+        - `ExtractionResult`: Tables, errors, and merge info
+        """,
+    }
+
+    API_DATA_CLASSES_MD = {
+        "ExtractedTable": """
+        A single extracted table with metadata.
+
+        **Attributes:**
+        - `dataframe` (pd.DataFrame): The table data
+        - `caption` (str | None): Detected caption
+        - `start_line` (int): Starting line number
+        - `end_line` (int): Ending line number
+        - `raw_markdown` (str): Original markdown
+        - `is_continuation` (bool): Continuation marker
+
+        **Properties:**
+        - `column_count` (int): Number of columns
+        - `row_count` (int): Number of rows
+        """,
+        "ExtractionResult": """
+        Complete extraction result with iteration support.
+
+        **Attributes:**
+        - `tables` (list[ExtractedTable]): Extracted tables
+        - `errors` (list[str]): Encountered errors
+        - `merged_count` (int): Number of merged tables
+
+        **Methods:**
+        - `get_dataframes()` → `list[pd.DataFrame]`
+
+        **Properties:**
+        - `has_errors` (bool): True if errors occurred
+
+        **Supports:**
+        - Iteration: `for table in result: ...`
+        - Indexing: `result[0]`
+        - Length: `len(result)`
+        """,
+        "TableMergeStrategy": """
+        Strategy for merging adjacent tables (Enum).
+
+        **Values:**
+        - `NONE`: Don't merge any tables
+        - `IDENTICAL_HEADERS`: Merge identical/similar headers
+        - `COMPATIBLE_COLUMNS`: Merge if columns within ±2
+        """,
+    }
+
+    API_REFERENCE_MD = {
+        "Parser": """
+        **Core parsing functions:**
+
+        - `is_separator_row(line: str) -> bool`
+          - Detects separators: `| --- |`, `| :--: |`, etc.
+
+        - `is_table_row(line: str) -> bool`
+          - Checks if line starts/ends with `|`
+
+        - `parse_table_row(line: str) -> list[str]`
+          - Extracts cell contents from a row
+
+        - `detect_caption(...) -> tuple`
+          - Finds captions like "Table 3. Results"
+          - Returns: `(caption, is_continuation, table_number, is_bare)`
+        """,
+        "Cleaner": """
+        **Data cleaning functions:**
+
+        - `clean_column_name(name: str) -> str`
+          - Removes HTML tags, normalizes whitespace
+
+        - `clean_value(value: str) -> str`
+          - Cleans cell values, replaces entities
+
+        - `headers_match(h1, h2, threshold=0.8) -> bool`
+          - Fuzzy header comparison for merging
+
+        - `normalize_headers(headers) -> list[str]`
+          - Prepares headers for comparison
+        """,
+        "Merger": """
+        **Table merging functions:**
+
+        - `merge_tables(tables, strategy) -> list`
+          - Merges continuation tables by strategy
+
+        - `should_merge_tables(t1, t2, strategy) -> bool`
+          - Determines if two tables should merge
+
+        - `is_continuation_table(table) -> bool`
+          - Detects "(Continued)" or similar markers
+        """,
+        "CLI": """
+        **Command-line interface:**
+
+        ```bash
+        # Extract to stdout
+        mte extract input.md
+
+        # Extract to CSV
+        mte extract input.md -o output.csv
+
+        # Extract to JSON
+        mte extract input.md -o output.json
+
+        # Show help
+        mte --help
+        ```
+        """,
+    }
+
+
+@app.cell
+def _():
+    import functools
+
+    import marimo as mo
+    # Import from top-level package to avoid micropip issues. The extraction
+    # functions are looked up on it when a page needs them, so pandas is not
+    # imported until then (the package exports are lazy).
+    import markdown_table_extractor
+    return functools, markdown_table_extractor, mo
+
+
+@app.cell
+def _(functools, mo):
+    # Helpers are cached: they are called with the same literal arguments
+    # every time a page is rebuilt, and the resulting Html is immutable
+
+    # Helper function to create code blocks with consistent styling
+    @functools.lru_cache(maxsize=None)
+    def code_block(code: str, language: str = "python") -> mo.Html:
+        return mo.md(f"```{language}\n{code}\n```")
+
+    # Helper function to create module cards
+    @functools.lru_cache(maxsize=None)
+    def module_card(name: str, description: str, functions: tuple[str, ...], command: str) -> mo.Html:
+        functions_list = "\n".join([f"- `{f}`" for f in functions])
+        return mo.md(MODULE_CARD_TEMPLATE.format(
+            name=name,
+            description=description,
+            functions_list=functions_list,
+            command=command,
+        ))
+    return code_block, module_card
+
+
+@app.cell
+def _(code_block, functools, mo):
+    # Home page content
+    @functools.lru_cache(maxsize=1)
+    def render_home():
+        return mo.vstack([
+            mo.md(HOME_INTRO_MD),
+            mo.callout(mo.md(HOME_CALLOUT_MD), kind="success"),
+            mo.md("## Features"),
+            mo.accordion(
+                {label: mo.md(body) for label, body in FEATURES_MD.items()},
+                multiple=True,
+                lazy=True,
+            ),
+            mo.md(ARCHITECTURE_MD),
+            mo.md("## Installation"),
+            mo.accordion({
+                tool: code_block(command, "bash")
+                for tool, command in INSTALL_COMMANDS.items()
+            }, lazy=True),
+        ])
+    return (render_home,)
+
+
+@app.cell
+def _(code_block, functools, markdown_table_extractor, mo):
+    # Quick Start content
+    @functools.lru_cache(maxsize=1)
+    def render_quick_start():
+        return mo.vstack([
+            mo.md("# ⚡ Quick Start"),
+
+            mo.callout(
+                "Get started in under 5 minutes!",
+                kind="info"
+            ),
+
+            mo.md("## Installation"),
+            code_block("pip install markdown-table-extractor", "bash"),
+
+            mo.md("## Basic Usage"),
+
+            mo.md("### Step 1: Import the library"),
+            code_block('''import marimo as mo
+import pandas as pd
+from markdown_table_extractor import extract_tables, extract_markdown_tables'''),
+
+            mo.md("### Step 2: Define a markdown document"),
+            code_block(f'markdown_text = """{EMPLOYEE_DIRECTORY_MD}"""'),
+
+            mo.md("### Step 3: See what the document looks like (rendered):"),
+            mo.md(EMPLOYEE_DIRECTORY_MD),
+
+            mo.md("### Step 4: Extract the table with one line of code:"),
+            code_block('''tables = extract_tables(markdown_text)
+tables[0]  # Returns a pandas DataFrame'''),
+
+            mo.md("### Result - Clean DataFrame:"),
+            mo.ui.table(
+                markdown_table_extractor.extract_tables(EMPLOYEE_DIRECTORY_MD)[0],
+                selection=None,
+            ),
+            mo.callout(
+                "✅ Table isolated and extracted as a clean pandas DataFrame - ready for analysis!",
+                kind="success"
+            ),
+
+            mo.md("## More Examples"),
+
+            mo.ui.tabs({
+                "Full API": mo.vstack([
+                    mo.md("Returns metadata along with DataFrames:"),
+                    code_block('''from markdown_table_extractor import extract_markdown_tables
+
+result = extract_markdown_tables(markdown_text)
+
+for table in result:
+    print(f"Caption: {table.caption}")
+    print(f"Rows: {table.row_count}, Cols: {table.column_count}")
+    print(table.dataframe)'''),
+                ]),
+
+                "Continuation Tables": mo.vstack([
+                    mo.md("Automatically merges tables marked as continuations:"),
+                    code_block(CONTINUATION_SNIPPET),
+                ]),
+
+                "CLI": mo.vstack([
+                    mo.md("Command-line interface for quick extractions:"),
+                    code_block('''# Extract to console
+mte extract document.md
+
+# Extract to CSV
+mte extract document.md -o output.csv
+
+# Extract to JSON
+mte extract document.md -o output.json''', "bash"),
+                ]),
+            }, lazy=True),
+
+            mo.callout(
+                mo.md("**Next:** Explore the Modules tab to see how each component works!"),
+                kind="success"
+            ),
+        ])
+    return (render_quick_start,)
+
+
+@app.cell
+def _(functools, mo, module_card):
+    # Modules documentation
+    @functools.lru_cache(maxsize=1)
+    def render_modules():
+        return mo.vstack([
+            mo.md("# 📦 Module Documentation"),
+            mo.callout(mo.md(MODULES_CALLOUT_MD), kind="info"),
+            mo.md("## Core Modules"),
+            mo.accordion({
+                label: module_card(name, description, functions, command)
+                for label, name, description, functions, command in MODULES_SPEC
+            }, lazy=True),
+            mo.md("## Module Dependencies"),
+            mo.mermaid(MODULE_DEPENDENCIES_DIAGRAM),
+            mo.md("Each module can be used independently or as part of the full pipeline!"),
+        ])
+    return (render_modules,)
+
+
+@app.cell
+def _(code_block, functools, markdown_table_extractor, mo):
+    # Live Examples content
+    @functools.lru_cache(maxsize=1)
+    def render_examples():
+        _academic_result = markdown_table_extractor.extract_markdown_tables(ACADEMIC_TABLE_MD)
+        _continued_result = markdown_table_extractor.extract_markdown_tables(CONTINUED_TABLES_MD)
+        _aligned_result = markdown_table_extractor.extract_tables(ALIGNED_TABLE_MD)
+
+        return mo.vstack([
+            mo.md("# 💡 Live Examples"),
+
+            mo.accordion({
+                "📄 Academic Paper Tables": mo.vstack([
+                    mo.md("""
+                **Scenario:** Extracting a patient demographics table from a clinical trial manuscript
+                that contains HTML artifacts from PDF conversion.
+                """),
+                    mo.md("### Input Document (rendered):"),
+                    mo.md(ACADEMIC_TABLE_MD),
+                    mo.md("---"),
+                    mo.md("### Extracted Table:"),
+                    mo.ui.table(_academic_result[0].dataframe, selection=None),
+                    mo.callout(
+                        f"✅ Caption detected: {_academic_result[0].caption} | HTML tags cleaned automatically!",
+                        kind="success"
+                    ),
+                ]),
+
+                "📑 Multi-page Tables": mo.vstack([
+                    mo.md("""
+                **Scenario:** Extracting a dataset that spans multiple pages in a manuscript,
+                with a continuation marker on the second page.
+                """),
+                    mo.md("### Input Document (rendered):"),
+                    mo.md(CONTINUED_TABLES_MD),
+                    mo.md("---"),
+                    mo.md("### Merged Result:"),
+                    mo.ui.table(_continued_result[0].dataframe, selection=None),
+                    mo.callout(
+                        f"✅ Auto-merged {_continued_result.merged_count} continuation table → {_continued_result[0].row_count} total rows",
+                        kind="success"
+                    ),
+                ]),
+
+                "⬅️➡️ Complex Alignment": mo.vstack([
+                    mo.md("""
+                **Scenario:** Parsing a table with mixed alignment markers (left, center, right)
+                from a formatting guide.
+                """),
+                    mo.md("### Input Document (rendered):"),
+                    mo.md(ALIGNED_TABLE_MD),
+                    mo.md("---"),
+                    mo.md("### Extracted Table:"),
+                    mo.ui.table(_aligned_result[0], selection=None),
+                    mo.callout(
+                        "✅ Alignment markers (:---, :---:, ---:) correctly detected!",
+                        kind="success"
+                    ),
+                ]),
+
+                "💾 Export Formats": mo.vstack([
+                    mo.md("Export to various formats using pandas:"),
+                    code_block('''result = extract_markdown_tables(markdown_text)
+
+    # CSV
+    result[0].dataframe.to_csv('output.csv', index=False)
+
+    # JSON
+    result[0].dataframe.to_json('output.json', orient='records')
+
+    # Excel
+    result[0].dataframe.to_excel('output.xlsx', index=False)
+
+    # Markdown
+    print(result[0].dataframe.to_markdown(index=False))'''),
+                ]),
+
+                "⚙️ Custom Merge Strategies": mo.vstack([
+                    mo.md("Control how continuation tables are merged:"),
+                    code_block('''from markdown_table_extractor.core.models import TableMergeStrategy
+
+    # Don't merge any tables
+    result = extract_markdown_tables(
+    text,
+    merge_strategy=TableMergeStrategy.NONE
+    )
+
+    # Merge tables with identical headers (default)
+    result = extract_markdown_tables(
+    text,
+    merge_strategy=TableMergeStrategy.IDENTICAL_HEADERS
+    )
+
+    # Merge tables with compatible column counts (±2)
+    result = extract_markdown_tables(
+    text,
+    merge_strategy=TableMergeStrategy.COMPATIBLE_COLUMNS
+    )'''),
+                ]),
+            }, lazy=True, multiple=True),
+        ])
+    return (render_examples,)
+
+
+@app.cell
+def _(functools, mo):
+    # API Reference content
+    @functools.lru_cache(maxsize=1)
+    def render_api():
+        return mo.vstack([
+            mo.md("# 📖 API Reference"),
+
+            mo.ui.tabs({
+                "Main Functions": mo.accordion(
+                    {name: mo.md(body) for name, body in API_MAIN_FUNCTIONS_MD.items()},
+                    lazy=True,
+                ),
+                "Data Classes": mo.accordion(
+                    {name: mo.md(body) for name, body in API_DATA_CLASSES_MD.items()},
+                    lazy=True,
+                ),
+                **{name: mo.md(body) for name, body in API_REFERENCE_MD.items()},
+            }, lazy=True),
+        ])
+    return (render_api,)
+
+
+@app.cell
+def _(mo):
+    # Navigation labels with icons, rendered once rather than per layout build
+    nav_labels = {
+        href: f"{mo.icon(icon)} {label}" for href, icon, label in NAV_PAGES
+    }
+    return (nav_labels,)
+
+
+@app.cell
+def _(
+    mo,
+    nav_labels,
+    render_api,
+    render_examples,
+    render_home,
+    render_modules,
+    render_quick_start,
+):
+    # Create navigation menu (keys=hrefs, values=labels)
+    _nav = mo.nav_menu(nav_labels, orientation="horizontal")
+
+    # Set up routes with hash-based navigation. mo.routes wraps callables in
+    # mo.lazy, so each page is only built when its route is first opened;
+    # the render_* functions are cached, so revisiting a route reuses it.
+    _routes = mo.routes({
+        "#/": render_home,
+        "#/quick-start": render_quick_start,
+        "#/modules": render_modules,
+        "#/examples": render_examples,
+        "#/api": render_api,
+        mo.routes.CATCH_ALL: render_home,
+    })
+
+    # Create and display the final layout
+    _layout = mo.vstack([
+        mo.md("# 📊 Markdown Table Extractor Documentation"),
+        mo.Html("<hr style='margin: 1rem 0; border: none; border-top: 2px solid #e0e0e0;'>"),
+        _nav,
+        mo.Html("<div style='margin: 2rem 0;'></div>"),
+        _routes,
+    ])
+
+    # Display the layout by having it as the last expression
+    _layout
+    return
+
+
+if __name__ == "__main__":
+    app.run()
@@ -0,0 +1,203 @@
+"""Interactive documentation for table merging.
+
+marimo notebook demonstrating `markdown_table_extractor.core.merger`.
+Kept separate from the library module so importing the package does not
+pull in marimo.
+
+Usage:
+    uv run marimo edit src/markdown_table_extractor/notebooks/merger.py
+"""
+import marimo
+
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+    import pandas as pd
+    from markdown_table_extractor.core.merger import (
+        CONTINUATION_PATTERN,
+        is_continuation_table,
+        should_merge_tables,
+        merge_tables,
+        merge_two_tables,
+    )
+    from markdown_table_extractor.core.models import ExtractedTable, TableMergeStrategy
+    return (mo, pd, CONTINUATION_PATTERN, is_continuation_table, should_merge_tables, merge_tables, merge_two_tables, ExtractedTable, TableMergeStrategy)
+
+
+@app.cell
+def _(mo):
+    mo.md("# Table Merger")
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `is_continuation_table(table: ExtractedTable) -> bool`
+
+    Check if a table has a continuation marker like "(Continued)" or "(Cont.)".
+    """)
+    return
+
+
+@app.cell
+def _(mo, pd, ExtractedTable, is_continuation_table):
+    # Example 1: Table with continuation marker
+    _cont_table = ExtractedTable(
+        dataframe=pd.DataFrame({"Name": ["Carol"], "Score": [92]}),
+        caption="Table 1 (Continued)",
+        is_continuation=True
+    )
+
+    # Example 2: Regular table
+    _regular_table = ExtractedTable(
+        dataframe=pd.DataFrame({"Name": ["Alice"], "Score": [95]}),
+        caption="Table 2. Results"
+    )
+
+    _is_cont1 = is_continuation_table(_cont_table)
+    _is_cont2 = is_continuation_table(_regular_table)
+
+    mo.vstack([
+        mo.md(f"**Table 1:** `{_cont_table.caption}` → `{_is_cont1}`"),
+        mo.md(f"**Table 2:** `{_regular_table.caption}` → `{_is_cont2}`"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `merge_two_tables(table1, table2) -> ExtractedTable`
+
+    Combine two tables into one, preserving the first table's caption.
+    """)
+    return
+
+
+@app.cell
+def _(mo, pd, ExtractedTable, merge_two_tables):
+    # Create two tables to merge
+    _t1 = ExtractedTable(
+        dataframe=pd.DataFrame({"ID": [1, 2], "Name": ["Alice", "Bob"]}),
+        caption="Table 1. Data"
+    )
+    _t2 = ExtractedTable(
+        dataframe=pd.DataFrame({"ID": [3, 4], "Name": ["Carol", "Dave"]}),
+        caption="Table 1 (Continued)",
+        is_continuation=True
+    )
+
+    _merged = merge_two_tables(_t1, _t2)
+
+    mo.vstack([
+        mo.md("**Before merging:**"),
+        mo.md(f"- Table 1: {_t1.row_count} rows"),
+        mo.md(f"- Table 2: {_t2.row_count} rows"),
+        mo.md("**After merging:**"),
+        mo.ui.table(_merged.dataframe, selection=None),
+        mo.callout(f"Merged into {_merged.row_count} total rows", kind="success"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ---
+
+    ## 🔗 Comprehensive Merge Demo
+    """)
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("## 🔍 Continuation Detection Demo")
+    return
+
+
+@app.cell
+def _(mo, CONTINUATION_PATTERN):
+    # Test continuation patterns with visual output
+    _test_captions = [
+        ("Table 3. Results", "Regular table caption"),
+        ("Table 3 (Continued)", "Standard continuation marker"),
+        ("Table 3 (cont.)", "Abbreviated continuation"),
+        ("Table 3 - cont'd", "Alternative continuation format"),
+        ("Table 4. Data Summary", "Another regular caption"),
+    ]
+
+    _results = []
+    for caption, description in _test_captions:
+        _is_cont = bool(CONTINUATION_PATTERN.search(caption))
+        _emoji = "🔗" if _is_cont else "📄"
+        _results.append(f"{_emoji} `{caption:35}` → **{_is_cont}** ({description})")
+
+    mo.md("\n\n".join(_results))
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## 🔗 Table Merging Demo
+
+    See how continuation tables are automatically merged into a single table.
+    """)
+    return
+
+
+@app.cell
+def _(mo, pd, ExtractedTable, merge_tables):
+    # Create sample tables with visual before/after
+    _df1 = pd.DataFrame({"ID": [1, 2], "Name": ["Alice", "Bob"], "Score": [95, 87]})
+    _df2 = pd.DataFrame({"ID": [3, 4], "Name": ["Carol", "Dave"], "Score": [92, 88]})
+
+    _t1 = ExtractedTable(_df1, caption="Table 1. Test Results")
+    _t2 = ExtractedTable(_df2, caption="Table 1 (Continued)", is_continuation=True)
+
+    _merged = merge_tables([_t1, _t2])
+
+    mo.vstack([
+        mo.md("### Before Merging"),
+        mo.accordion({
+            "Table 1 (Original)": mo.vstack([
+                mo.md(f"**Caption:** `{_t1.caption}`"),
+                mo.md(f"**Rows:** {_t1.row_count}, **Columns:** {_t1.column_count}"),
+                mo.ui.table(_t1.dataframe),
+            ]),
+            "Table 2 (Continuation)": mo.vstack([
+                mo.md(f"**Caption:** `{_t2.caption}`"),
+                mo.md(f"**Is Continuation:** {_t2.is_continuation} ✓"),
+                mo.md(f"**Rows:** {_t2.row_count}, **Columns:** {_t2.column_count}"),
+                mo.ui.table(_t2.dataframe),
+            ]),
+        }),
+
+        mo.md("### After Merging"),
+        mo.callout(
+            f"Merged **2 tables** into **1 table** with **{_merged[0].row_count} total rows**",
+            kind="success"
+        ),
+        mo.ui.table(_merged[0].dataframe),
+
+        mo.md("### Merge Details"),
+        mo.accordion({
+            "Final Table Info": mo.md(f"""
+            - **Caption:** `{_merged[0].caption}`
+            - **Total Rows:** {_merged[0].row_count}
+            - **Columns:** {_merged[0].column_count}
+            - **Is Continuation:** {_merged[0].is_continuation}
+            - **Original Tables:** 2 → 1
+            """),
+        }),
+    ])
+    return
+
+
+if __name__ == "__main__":
+    app.run()
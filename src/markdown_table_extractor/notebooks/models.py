@@ -0,0 +1,110 @@
+"""Interactive documentation for data models.
+
+marimo notebook demonstrating `markdown_table_extractor.core.models`.
+Kept separate from the library module so importing the package does not
+pull in marimo.
+
+Usage:
+    uv run marimo edit src/markdown_table_extractor/notebooks/models.py
+"""
+import marimo
+
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+    import pandas as pd
+    from markdown_table_extractor.core.models import (
+        ExtractedTable,
+        ExtractionResult,
+        TableMergeStrategy,
+    )
+    return (mo, pd, ExtractedTable, ExtractionResult, TableMergeStrategy)
+
+
+@app.cell
+def _(mo):
+    mo.md("# Data Models")
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `TableMergeStrategy` (Enum)
+
+    Controls how continuation tables are merged.
+    """)
+    return
+
+
+@app.cell
+def _(mo, TableMergeStrategy):
+    mo.vstack([
+        mo.md("**Available strategies:**"),
+        mo.md(f"- `NONE` = `{TableMergeStrategy.NONE.value}` - Don't merge any tables"),
+        mo.md(f"- `IDENTICAL_HEADERS` = `{TableMergeStrategy.IDENTICAL_HEADERS.value}` - Merge if headers match"),
+        mo.md(f"- `COMPATIBLE_COLUMNS` = `{TableMergeStrategy.COMPATIBLE_COLUMNS.value}` - Merge if columns within ±2"),
+    ])
+    return
+
+
+@app.cell
+def _(mo):
+    mo.md("""
+    ## `ExtractedTable` (dataclass)
+
+    Represents a single extracted table with metadata.
+    """)
+    return
+
+
+@app.cell
+def _(mo, pd, ExtractedTable):
+    # Live demo - create an ExtractedTable instance
+    _demo_df = pd.DataFrame({"Name": ["Alice", "Bob"], "Score": [95, 87]})
+    _demo_table = ExtractedTable(
+        dataframe=_demo_df,
+        caption="Table 1. Test Scores",
+        start_line=5,
+        end_line=7,
+        raw_markdown="| Name | Score |\n|------|-------|\n| Alice | 95 |\n| Bob | 87 |",
+        is_continuation=False,
+    )
+
+    mo.vstack([
+        mo.md("## 📋 ExtractedTable Example"),
+        mo.md("**Creating an ExtractedTable instance:**"),
+        mo.md("""
+        ```python
+        table = ExtractedTable(
+            dataframe=df,
+            caption="Table 1. Test Scores",
+            start_line=5,
+            end_line=7,
+            is_continuation=False
+        )
+        ```
+        """),
+        mo.md("**Table Data:**"),
+        mo.ui.table(_demo_table.dataframe, selection=None),
+        mo.md("**Table Properties:**"),
+        mo.accordion({
+            "Metadata": mo.md(f"""
+            - **Caption:** `{_demo_table.caption}`
+            - **Rows:** {_demo_table.row_count}
+            - **Columns:** {_demo_table.column_count}
+            - **Start Line:** {_demo_table.start_line}
+            - **End Line:** {_demo_table.end_line}
+            - **Is Continuation:** {_demo_table.is_continuation}
+            """),
+            "Raw Markdown": mo.md(f"```markdown\n{_demo_table.raw_markdown}\n```"),
+        }),
+    ])
+    return
+
+
+if __name__ == "__main__":
+    app.run()
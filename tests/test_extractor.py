@@ -1,5 +1,9 @@
 """Tests for core extraction functionality."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 import pandas as pd
 
@@ -77,6 +81,20 @@ Some text between tables.
         assert list(tables[0].columns) == ["A", "B"]
         assert list(tables[1].columns) == ["X", "Y", "Z"]
     
+    def test_repeated_separator_in_body(self):
+        markdown = """
+| Change | Date |
+|---|---|
+| -5 | 2021-03-01 |
+|:--|--:|
+| --- Data | - |
+"""
+        tables = extract_tables(markdown)
+
+        assert len(tables) == 1
+        assert tables[0]["Change"].tolist() == ["-5", "--- Data"]
+        assert tables[0]["Date"].tolist() == ["2021-03-01", "-"]
+
     def test_empty_text(self):
         tables = extract_tables("")
         assert len(tables) == 0
@@ -116,6 +134,19 @@ Table 3. (Continued)
         assert result.merged_count == 1
         assert len(result.tables[0].dataframe) == 4
     
+    def test_multi_part_continuation_merge(self):
+        page = "| Study | Outcome |\n|-------|---------|\n| {0} | Good |\n"
+        markdown = "Table 3. Results\n\n" + page.format("A") + "".join(
+            f"\nTable 3 (Continued)\n\n{page.format(study)}" for study in "BCD"
+        )
+
+        result = extract_markdown_tables(markdown)
+
+        assert len(result.tables) == 1
+        assert result.merged_count == 3
+        assert list(result.tables[0].dataframe["Study"]) == ["A", "B", "C", "D"]
+        assert result.tables[0].raw_markdown.count("| Study | Outcome |") == 4
+
     def test_no_merge_strategy(self):
         markdown = """
 | A | B |
@@ -135,6 +166,74 @@ Table 3. (Continued)
         assert result.merged_count == 0
 
 
+class _StubFuzz:
+    """Stand-in for rapidfuzz.fuzz with fixed per-column scores."""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.calls = 0
+
+    def token_set_ratio(self, s1, s2, score_cutoff=0):
+        self.calls += 1
+        score = self.scores[s1]
+        # rapidfuzz reports scores below the cutoff as 0
+        return score if score >= score_cutoff else 0
+
+
+class TestHeaderSimilarity:
+    """Test header comparison with and without rapidfuzz."""
+
+    @pytest.mark.parametrize("scores,expected", [
+        ((100, 70), True),
+        ((80, 80), False),
+        ((90, 70), False),
+        ((81, 80), True),
+        ((70, 100), True),
+    ])
+    def test_fuzzy_average_threshold(self, monkeypatch, scores, expected):
+        from markdown_table_extractor.core import merger
+
+        cols = [f"col{i}" for i in range(len(scores))]
+        stub = _StubFuzz(dict(zip(cols, scores)))
+        monkeypatch.setattr(merger, "_fuzz", stub)
+
+        assert merger._check_header_similarity(cols, ["x"] * len(cols)) is expected
+
+    def test_fuzzy_stops_once_threshold_unreachable(self, monkeypatch):
+        from markdown_table_extractor.core import merger
+
+        stub = _StubFuzz({"a": 0, "b": 100, "c": 100})
+        monkeypatch.setattr(merger, "_fuzz", stub)
+
+        assert merger._check_header_similarity(["a", "b", "c"], ["x", "y", "z"]) is False
+        assert stub.calls == 1
+
+    def test_identical_headers_skip_scorer(self, monkeypatch):
+        from markdown_table_extractor.core import merger
+
+        stub = _StubFuzz({"Study": 0, "Outcome": 0, "": 0})
+        monkeypatch.setattr(merger, "_fuzz", stub)
+
+        assert merger._check_header_similarity(["Study", "Outcome"], ["Study", "Outcome"])
+        assert stub.calls == 0
+
+        # Blank headers still go through the scorer
+        assert merger._check_header_similarity(["Study", ""], ["Study", ""]) is False
+        assert stub.calls > 0
+
+    @pytest.mark.parametrize("cols2,expected", [
+        (["study", " OUTCOME "], True),
+        (["Study", "Outcomes"], False),
+        (["Study"], False),
+    ])
+    def test_exact_match_without_rapidfuzz(self, monkeypatch, cols2, expected):
+        from markdown_table_extractor.core import merger
+
+        monkeypatch.setattr(merger, "_fuzz", None)
+
+        assert merger._check_header_similarity(["Study", "Outcome"], cols2) is expected
+
+
 class TestCaptionDetection:
     """Test table caption detection."""
     
@@ -176,6 +275,22 @@ Table 3 (Continued)
         
         assert result.tables[0].is_continuation is True
 
+    @pytest.mark.parametrize("caption,expected", [
+        ("Table 3. Control group outcomes", False),
+        ("Table 2. Contraceptive use", False),
+        ("Table 5: Content analysis", False),
+        ("Table 2 (cont.)", True),
+        ("Table 2 cont'd", True),
+    ])
+    def test_continuation_marker_is_whole_word(self, caption: str, expected: bool):
+        from markdown_table_extractor.core.parser import CONTINUATION_PATTERN
+
+        # The LLM path flags its captions with the same pattern
+        assert bool(CONTINUATION_PATTERN.search(caption)) is expected
+
+        result = extract_markdown_tables(f"{caption}\n\n| A | B |\n|---|---|\n| 1 | 2 |\n")
+        assert result.tables[0].is_continuation is expected
+
 
 class TestHTMLCleaning:
     """Test HTML artifact cleaning in column names."""
@@ -193,6 +308,32 @@ class TestHTMLCleaning:
         assert "<br>" not in cols[0]
         assert "<br>" not in cols[1]
 
+    def test_clean_column_name_cached(self):
+        from markdown_table_extractor.core.cleaner import clean_column_name
+
+        first = clean_column_name("Mean <br> Age")
+        assert first == "Mean Age"
+        assert clean_column_name("Mean <br> Age") is first
+
+    @pytest.mark.parametrize("value,expected", [
+        ("plain  value ", "plain value"),
+        ("Data<br>with&nbsp;HTML", "Data with HTML"),
+        ("a &amp; b", "a & b"),
+        ("&lt;5", "<5"),
+        ("x &gt; y<span>!</span>", "x > y !"),
+        ("it&#39;s &quot;ok&quot;", "it's \"ok\""),
+        ("&#x27;q&#X27; &copy; 2020", "'q' © 2020"),
+        # Entities without a terminating semicolon are plain text
+        ("x&notes", "x&notes"),
+        ("Smith&copy", "Smith&copy"),
+        ("R&D &unknown;", "R&D &unknown;"),
+        ("", ""),
+    ])
+    def test_clean_value(self, value: str, expected: str):
+        from markdown_table_extractor.core.cleaner import clean_value
+
+        assert clean_value(value) == expected
+
 
 class TestSubHeaderHandling:
     """Test multi-level header handling."""
@@ -212,6 +353,21 @@ class TestSubHeaderHandling:
         # The exact behavior depends on implementation
         assert len(df) >= 2  # Should have data rows
 
+    @pytest.mark.parametrize("headers,sub_header,expected", [
+        (["Name", "Age", ""], ["", "", "Years"], ["Name", "Age", "Years"]),
+        (["Morbidity", " ", ""], [" Early ", "Late", ""], ["Morbidity Early", "Late", ""]),
+        # Short sub-header rows keep every main header
+        (["Outcome", "Score"], ["Early"], ["Outcome Early", "Score"]),
+        # Extra sub-header cells don't add columns
+        (["A"], ["x", "y"], ["A x"]),
+        # Blank sub-header rows just return the stripped headers
+        ([" Name ", "Age"], [" ", ""], ["Name", "Age"]),
+    ])
+    def test_merge_sub_header(self, headers, sub_header, expected):
+        from markdown_table_extractor.core.cleaner import merge_sub_header
+
+        assert merge_sub_header(headers, sub_header) == expected
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -275,8 +431,120 @@ class TestFullAPI:
         assert isinstance(dfs, list)
         assert isinstance(dfs[0], pd.DataFrame)
     
+    def test_result_objects_accept_extra_attributes(self):
+        result = extract_markdown_tables("| A | B |\n|---|---|\n| 1 | 2 |\n")
+
+        # Callers may annotate results with their own metadata
+        result.source = "doc.md"
+        result.tables[0].page = 3
+        assert result.tables[0].page == 3
+
     def test_error_collection(self):
         result = extract_markdown_tables("")
         
         # Should not have errors for empty input
         assert result.has_errors is False
+
+
+class TestCLIOutput:
+    """Test CLI output formatting."""
+
+    @pytest.mark.parametrize("markdown", [
+        "Table 1. A\n\n| a | b |\n|---|---|\n| 1 | 2/3 |\n",
+        # Duplicate column names
+        "| a | a |\n|---|---|\n| 1 | 2 |\n",
+    ])
+    def test_json_output(self, markdown: str):
+        import json
+
+        from markdown_table_extractor.cli import format_output
+
+        result = extract_markdown_tables(markdown)
+        data = json.loads(format_output(result, "json"))
+
+        assert len(data) == 1
+        assert data[0]["rows"] == 1
+        assert len(data[0]["data"]) == 1
+
+    def test_csv_output(self):
+        from markdown_table_extractor.cli import format_output
+
+        result = extract_markdown_tables(
+            "Table 1. A\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+        )
+        assert format_output(result, "csv") == "# Table 1. A\na,b\n1,2\n"
+
+    def test_output_file_untouched_on_error(self, tmp_path, monkeypatch):
+        from markdown_table_extractor import cli
+
+        source = tmp_path / "in.md"
+        source.write_text("| a | b |\n|---|---|\n| 1 | 2 |\n")
+        out = tmp_path / "out.txt"
+        out.write_text("keep me")
+
+        # Rich output is rejected before the file is opened
+        assert cli.main(["extract", str(source), "-f", "rich", "-o", str(out)]) == 1
+        assert out.read_text() == "keep me"
+
+        def fail(result, fmt, fp):
+            fp.write("partial")
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(cli, "stream_output", fail)
+        with pytest.raises(RuntimeError):
+            cli.main(["extract", str(source), "-o", str(out)])
+        assert out.read_text() == "keep me"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["in.md", "out.txt"]
+
+        monkeypatch.undo()
+        assert cli.main(["extract", str(source), "-o", str(out)]) == 0
+        assert out.read_text() == "a,b\n1,2\n"
+
+    def test_output_file_keeps_mode_and_links(self, tmp_path):
+        from markdown_table_extractor import cli
+
+        source = tmp_path / "in.md"
+        source.write_text("| a | b |\n|---|---|\n| 1 | 2 |\n")
+
+        out = tmp_path / "out.csv"
+        out.write_text("old")
+        out.chmod(0o640)
+        assert cli.main(["extract", str(source), "-o", str(out)]) == 0
+        assert out.read_text() == "a,b\n1,2\n"
+        assert out.stat().st_mode & 0o777 == 0o640
+
+        # Hard-linked targets are written in place so the link survives
+        link = tmp_path / "link.csv"
+        os.link(out, link)
+        out.write_text("old")
+        assert cli.main(["extract", str(source), "-o", str(out)]) == 0
+        assert link.read_text() == "a,b\n1,2\n"
+
+
+class TestImports:
+    """Test import-time behavior of the package."""
+
+    @staticmethod
+    def _module_loaded_after(statement: str, module: str) -> bool:
+        # Run in a fresh interpreter so modules loaded by other tests don't leak in
+        code = f"import sys; {statement}; sys.exit({module!r} in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        return subprocess.run([sys.executable, "-c", code], env=env).returncode != 0
+
+    def test_import_does_not_load_marimo(self):
+        assert not self._module_loaded_after(
+            "from markdown_table_extractor import extract_tables", "marimo"
+        )
+
+    def test_cli_import_does_not_load_pandas(self):
+        assert not self._module_loaded_after(
+            "import markdown_table_extractor.cli", "pandas"
+        )
+
+    def test_lazy_public_api(self):
+        import markdown_table_extractor
+
+        assert markdown_table_extractor.extract_tables is extract_tables
+        assert "extract_tables" in dir(markdown_table_extractor)
+        with pytest.raises(AttributeError):
+            markdown_table_extractor.does_not_exist